@@ -7,6 +7,7 @@ Owner: Platform.Engineering
 
 from __future__ import annotations
 
+import functools
 import os
 from dataclasses import dataclass
 from pathlib import Path
@@ -14,7 +15,10 @@ from typing import Optional
 
 from dotenv import load_dotenv
 
-load_dotenv()
+# Guard against re-parsing .env on repeated imports (e.g. under pytest).
+if not os.getenv("ACMS_DOTENV_LOADED"):
+    load_dotenv()
+    os.environ["ACMS_DOTENV_LOADED"] = "1"
 
 
 @dataclass(frozen=True)
@@ -27,19 +31,32 @@ class ACMSConfig:
 
     @staticmethod
     def from_env() -> "ACMSConfig":
-        """Construct configuration from environment variables with defaults."""
-        workspace_root = Path(
-            os.getenv("ACMS_WORKSPACE_ROOT", Path.cwd())
-        ).resolve()
-        ledger_path = Path(
-            os.getenv("ACMS_LEDGER_PATH", workspace_root / "ledger.jsonl")
-        ).resolve()
-        jaeger_endpoint = os.getenv("ACMS_JAEGER_ENDPOINT")
-        return ACMSConfig(
-            workspace_root=workspace_root,
-            ledger_path=ledger_path,
-            jaeger_endpoint=jaeger_endpoint,
-        )
-
+        """Construct configuration from environment variables with defaults.
+
+        The result is cached for the lifetime of the process so the env
+        lookups and ``Path.resolve`` filesystem calls happen once. Changes to
+        ``os.environ`` made afterwards are not observed unless the cache is
+        cleared via ``ACMSConfig.from_env.cache_clear()``.
+        """
+        return _config_from_env()
+
+
+@functools.lru_cache(maxsize=1)
+def _config_from_env() -> ACMSConfig:
+    workspace_root = Path(
+        os.getenv("ACMS_WORKSPACE_ROOT", Path.cwd())
+    ).resolve()
+    ledger_path = Path(
+        os.getenv("ACMS_LEDGER_PATH", workspace_root / "ledger.jsonl")
+    ).resolve()
+    jaeger_endpoint = os.getenv("ACMS_JAEGER_ENDPOINT")
+    return ACMSConfig(
+        workspace_root=workspace_root,
+        ledger_path=ledger_path,
+        jaeger_endpoint=jaeger_endpoint,
+    )
+
+
+ACMSConfig.from_env.cache_clear = _config_from_env.cache_clear  # type: ignore[attr-defined]
 
 __all__ = ["ACMSConfig"]
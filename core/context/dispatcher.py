@@ -13,17 +13,44 @@ non-interactive automation environments.
 """
 from __future__ import annotations
 
+import functools
+import hashlib
+import itertools
 import json
 import logging
 import subprocess
 import sys
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
-from datetime import datetime
 from pathlib import Path
-from typing import Callable, Dict, Iterable, List, Optional, Sequence
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 
 LOGGER = logging.getLogger("acms.llm_dispatcher")
 
+# Number of distinct manifest requests remembered per dispatcher instance.
+_MANIFEST_CACHE_SIZE = 32
+
+_PY = sys.executable or "python"
+
+# Per-second formatted timestamp cache plus a monotonic suffix so bulk
+# dispatch loops avoid a strftime call per manifest while keeping paths unique.
+_TS_CACHE: Dict[str, object] = {"sec": 0, "str": ""}
+_MANIFEST_COUNTER = itertools.count()
+
+
+def _utc_second_stamp() -> str:
+    now = int(time.time())
+    if now != _TS_CACHE["sec"]:
+        _TS_CACHE["sec"] = now
+        _TS_CACHE["str"] = time.strftime("%Y%m%dT%H%M%S", time.gmtime(now))
+    return _TS_CACHE["str"]  # type: ignore[return-value]
+
+
+@functools.lru_cache(maxsize=16)
+def _safe_task_type(task_type: str) -> str:
+    return task_type.replace("/", "-")
+
 
 @dataclass(frozen=True)
 class DispatchResult:
@@ -55,6 +82,39 @@ class LLMToolDispatcher:
         self.manifest_dir = Path(manifest_dir or (self.repo_root / ".runs" / "manifests")).resolve()
         self.manifest_dir.mkdir(parents=True, exist_ok=True)
         self._run = run or subprocess.run
+        self._manifest_cache: OrderedDict[str, Tuple[Dict[str, object], Path]] = OrderedDict()
+        # The persistent broker is only used with the real subprocess module;
+        # injected runners (tests, dry-run harnesses) keep the one-shot path.
+        self._server_enabled = run is None
+        self._broker_proc: Optional[subprocess.Popen] = None
+        # Invariant command prefixes, built once per dispatcher instance.
+        self._aider_base: List[str] = ["aider"]
+        self._claude_base: List[str] = [_PY, "-m", "claude_code", "plan", "--no-tui"]
+        self._broker_prefix: List[str] = [_PY, str(self.broker_script), "--root", str(self.repo_root)]
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+    def close(self) -> None:
+        """Terminate the persistent broker subprocess if one is running."""
+
+        proc = self._broker_proc
+        self._broker_proc = None
+        if proc is None:
+            return
+        try:
+            if proc.stdin:
+                proc.stdin.close()
+            proc.terminate()
+            proc.wait(timeout=5)
+        except Exception:  # pragma: no cover - best-effort shutdown
+            proc.kill()
+
+    def __enter__(self) -> "LLMToolDispatcher":
+        return self
+
+    def __exit__(self, exc_type: object, exc: object, tb: object) -> None:
+        self.close()
 
     # ------------------------------------------------------------------
     # Public API
@@ -70,6 +130,7 @@ class LLMToolDispatcher:
         model: str = "deepseek-coder",
         extra_flags: Optional[Iterable[str]] = None,
         dry_run: bool = False,
+        force_refresh: bool = False,
     ) -> DispatchResult:
         """Invoke Aider with filtered context."""
 
@@ -79,15 +140,11 @@ class LLMToolDispatcher:
             keywords=list(keywords or []),
             max_tokens=max_tokens,
             include_tests=include_tests,
+            force_refresh=force_refresh,
         )
 
-        cmd: List[str] = [
-            "aider",
-            "--model",
-            model,
-            "--message",
-            task_description,
-        ]
+        cmd: List[str] = list(self._aider_base)
+        cmd.extend(["--model", model, "--message", task_description])
 
         for file_info in manifest.get("files", []):
             cmd.extend(["--read", self._normalise_path(file_info.get("path", ""))])
@@ -114,6 +171,7 @@ class LLMToolDispatcher:
         include_tests: Optional[bool] = None,
         extra_flags: Optional[Iterable[str]] = None,
         dry_run: bool = False,
+        force_refresh: bool = False,
     ) -> DispatchResult:
         """Invoke Claude Code CLI with filtered context."""
 
@@ -123,9 +181,10 @@ class LLMToolDispatcher:
             keywords=list(keywords or []),
             max_tokens=max_tokens,
             include_tests=include_tests,
+            force_refresh=force_refresh,
         )
 
-        cmd: List[str] = [sys.executable or "python", "-m", "claude_code", "plan", "--no-tui"]
+        cmd: List[str] = list(self._claude_base)
         for file_info in manifest.get("files", []):
             cmd.extend(["--file", self._normalise_path(file_info.get("path", ""))])
 
@@ -154,18 +213,47 @@ class LLMToolDispatcher:
         keywords: Sequence[str],
         max_tokens: Optional[int],
         include_tests: Optional[bool],
+        force_refresh: bool = False,
     ) -> tuple[Dict[str, object], Path]:
+        cache_key = self._manifest_cache_key(
+            task_type=task_type,
+            target_files=target_files,
+            keywords=keywords,
+            max_tokens=max_tokens,
+            include_tests=include_tests,
+        )
+        if not force_refresh:
+            cached = self._manifest_cache.get(cache_key)
+            if cached is not None:
+                self._manifest_cache.move_to_end(cache_key)
+                LOGGER.debug("Reusing cached manifest for key %s", cache_key)
+                return cached
+
         manifest_path = self._build_manifest_path(task_type)
-        cmd: List[str] = [
-            sys.executable or "python",
-            str(self.broker_script),
-            "--root",
-            str(self.repo_root),
-            "--out",
-            str(manifest_path),
-            "--task-type",
-            task_type,
-        ]
+
+        if self._server_enabled:
+            try:
+                manifest = self._generate_via_server(
+                    task_type=task_type,
+                    target_files=target_files,
+                    keywords=keywords,
+                    max_tokens=max_tokens,
+                    include_tests=include_tests,
+                    manifest_path=manifest_path,
+                )
+                self._store_manifest(cache_key, manifest, manifest_path)
+                return manifest, manifest_path
+            except ManifestGenerationError:
+                raise
+            except Exception as exc:
+                # Broker binaries without --server support fall back to the
+                # one-shot invocation for the rest of this dispatcher's life.
+                LOGGER.debug("Persistent broker unavailable (%s); using one-shot mode", exc)
+                self._server_enabled = False
+                self.close()
+
+        cmd: List[str] = list(self._broker_prefix)
+        cmd.extend(["--out", str(manifest_path), "--task-type", task_type])
 
         for keyword in keywords:
             cmd.extend(["--keywords", keyword])
@@ -190,12 +278,87 @@ class LLMToolDispatcher:
         except Exception as exc:  # pragma: no cover - defensive
             raise ManifestGenerationError(f"Failed to read manifest {manifest_path}: {exc}") from exc
 
+        self._store_manifest(cache_key, manifest, manifest_path)
         return manifest, manifest_path
 
+    def _store_manifest(self, cache_key: str, manifest: Dict[str, object], manifest_path: Path) -> None:
+        self._manifest_cache[cache_key] = (manifest, manifest_path)
+        self._manifest_cache.move_to_end(cache_key)
+        while len(self._manifest_cache) > _MANIFEST_CACHE_SIZE:
+            self._manifest_cache.popitem(last=False)
+
+    def _start_broker(self) -> subprocess.Popen:
+        proc = subprocess.Popen(
+            self._broker_prefix + ["--server"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            bufsize=1,
+        )
+        return proc
+
+    def _generate_via_server(
+        self,
+        *,
+        task_type: str,
+        target_files: Sequence[str],
+        keywords: Sequence[str],
+        max_tokens: Optional[int],
+        include_tests: Optional[bool],
+        manifest_path: Path,
+    ) -> Dict[str, object]:
+        """Request a manifest from the long-lived broker subprocess."""
+
+        if self._broker_proc is None or self._broker_proc.poll() is not None:
+            self._broker_proc = self._start_broker()
+
+        request = {
+            "task_type": task_type,
+            "targets": [str(path) for path in target_files],
+            "keywords": list(keywords),
+            "max_tokens": max_tokens,
+            "include_tests": include_tests,
+            "out": str(manifest_path),
+        }
+        assert self._broker_proc.stdin and self._broker_proc.stdout
+        self._broker_proc.stdin.write(json.dumps(request) + "\n")
+        self._broker_proc.stdin.flush()
+        reply_line = self._broker_proc.stdout.readline()
+        if not reply_line:
+            raise RuntimeError("broker closed its stdout before replying")
+
+        reply = json.loads(reply_line)
+        if reply.get("status") != "ok":
+            raise ManifestGenerationError(reply.get("message", "broker request failed"))
+
+        return json.loads(manifest_path.read_text(encoding="utf-8"))
+
+    @staticmethod
+    def _manifest_cache_key(
+        *,
+        task_type: str,
+        target_files: Sequence[str],
+        keywords: Sequence[str],
+        max_tokens: Optional[int],
+        include_tests: Optional[bool],
+    ) -> str:
+        body = json.dumps(
+            {
+                "t": task_type,
+                "f": sorted(str(path) for path in target_files),
+                "k": sorted(keywords),
+                "m": max_tokens,
+                "it": include_tests,
+            },
+            sort_keys=True,
+        )
+        return hashlib.blake2b(body.encode("utf-8"), digest_size=16).hexdigest()
+
     def _build_manifest_path(self, task_type: str) -> Path:
-        timestamp = datetime.utcnow().strftime("%Y%m%dT%H%M%S")
-        safe_task = task_type.replace("/", "-")
-        return self.manifest_dir / f"context_{safe_task}_{timestamp}.json"
+        timestamp = _utc_second_stamp()
+        safe_task = _safe_task_type(task_type)
+        return self.manifest_dir / f"context_{safe_task}_{timestamp}_{next(_MANIFEST_COUNTER)}.json"
 
     @staticmethod
     def _normalise_path(path: str) -> str:
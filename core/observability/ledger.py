@@ -10,19 +10,59 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Iterable, Iterator, Mapping, MutableMapping, Optional
+from typing import (
+    Any,
+    BinaryIO,
+    Iterable,
+    Iterator,
+    Mapping,
+    MutableMapping,
+    Optional,
+    TypedDict,
+)
+import atexit
+import io
 import json
+import os
+import sys
 import threading
+import weakref
+
+try:  # pragma: no cover - optional accelerated serializer
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None
 
 __all__ = ["Ledger", "LedgerRecord", "load_ledger"]
 
 
-class LedgerRecord(dict):
-    """Typed mapping representing a single ledger entry."""
+class LedgerRecord(TypedDict, total=False):
+    """Typed mapping representing a single ledger entry.
+
+    A ``TypedDict`` carries the typing information with zero runtime cost;
+    records are plain dict literals on the hot logging path.
+    """
 
     timestamp: str
     event_type: str
     correlation_id: Optional[str]
+    payload: Mapping[str, Any]
+    metadata: Mapping[str, Any]
+
+
+# Event types are drawn from a small finite set, so intern them once and
+# reuse the canonical string across millions of records. Correlation ids are
+# deliberately not interned: the orchestrator mints a fresh ULID per
+# workflow, so caching them would grow without bound for the life of the
+# process.
+_intern_cache: dict[str, str] = {}
+
+
+def _intern(value: str) -> str:
+    cached = _intern_cache.get(value)
+    if cached is None:
+        cached = _intern_cache.setdefault(value, sys.intern(value))
+    return cached
 
 
 def _json_default(value: Any) -> Any:  # pragma: no cover - formatting helper
@@ -54,6 +94,25 @@ def _normalise_mapping(data: Mapping[str, Any]) -> MutableMapping[str, Any]:
     return normalised
 
 
+# Live ledgers are tracked weakly and flushed by one module-level atexit
+# hook: registering a bound close per instance would pin every ledger for
+# the life of the process, leaking handles in long-running orchestrators
+# that create many short-lived ledgers. Keyed by id() because the eq
+# dataclass is unhashable; collected instances simply drop out.
+_live_ledgers: "weakref.WeakValueDictionary[int, Ledger]" = weakref.WeakValueDictionary()
+
+
+def _close_live_ledgers() -> None:  # pragma: no cover - interpreter shutdown
+    for ledger in list(_live_ledgers.values()):
+        try:
+            ledger.close()
+        except Exception:
+            pass
+
+
+atexit.register(_close_live_ledgers)
+
+
 @dataclass
 class Ledger:
     """Append-only JSONL ledger with deterministic ordering."""
@@ -62,11 +121,20 @@ class Ledger:
     ensure_directory: bool = True
     sort_keys: bool = True
     _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+    _handle: Optional[BinaryIO] = field(default=None, init=False, repr=False)
 
     def __post_init__(self) -> None:
         self.path = Path(self.path)
         if self.ensure_directory:
             self.path.parent.mkdir(parents=True, exist_ok=True)
+        _live_ledgers[id(self)] = self
+
+    def _ensure_handle(self) -> BinaryIO:
+        """Return the append handle, opening it lazily on first use."""
+
+        if self._handle is None:
+            self._handle = open(self.path, "ab", buffering=io.DEFAULT_BUFFER_SIZE)
+        return self._handle
 
     def log(
         self,
@@ -78,57 +146,173 @@ class Ledger:
     ) -> LedgerRecord:
         """Record an event in the ledger and return the stored entry."""
 
-        record: LedgerRecord = LedgerRecord(
-            timestamp=datetime.now(timezone.utc).isoformat(),
-            event_type=event_type,
-            correlation_id=correlation_id,
-        )
+        record: LedgerRecord = {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "event_type": _intern(event_type),
+            "correlation_id": correlation_id,
+        }
 
-        if payload:
-            record["payload"] = _normalise_mapping(payload)
-        if metadata:
-            record["metadata"] = _normalise_mapping(metadata)
+        if orjson is not None:
+            # orjson serialises nested mappings, datetimes and dataclasses in
+            # a single C pass, so the recursive normalisation is unnecessary.
+            if payload:
+                record["payload"] = payload
+            if metadata:
+                record["metadata"] = metadata
+            option = orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
+            if self.sort_keys:
+                option |= orjson.OPT_SORT_KEYS
+            buf = orjson.dumps(record, default=_json_default, option=option)
+        else:
+            if payload:
+                record["payload"] = _normalise_mapping(payload)
+            if metadata:
+                record["metadata"] = _normalise_mapping(metadata)
+            serialised = json.dumps(
+                record,
+                ensure_ascii=False,
+                sort_keys=self.sort_keys,
+                default=_json_default,
+            )
+            buf = serialised.encode("utf-8") + b"\n"
+        with self._lock:
+            self._ensure_handle().write(buf)
+        return record
 
-        serialised = json.dumps(
-            record,
-            ensure_ascii=False,
-            sort_keys=self.sort_keys,
-            default=_json_default,
-        )
+    def log_batch(
+        self,
+        event_type: str,
+        payloads: Iterable[Mapping[str, Any]],
+        *,
+        correlation_id: Optional[str] = None,
+        metadata: Optional[Mapping[str, Any]] = None,
+    ) -> list[LedgerRecord]:
+        """Record several events of one type with a single buffered write.
+
+        Serialization happens outside the lock and all lines land in one
+        ``write`` call, so callers logging a burst of related events (e.g.
+        one wave of tasks) pay the locking and I/O overhead once.
+        """
+
+        records: list[LedgerRecord] = []
+        chunks: list[bytes] = []
+        event_type = _intern(event_type)
+
+        for payload in payloads:
+            record: LedgerRecord = {
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "event_type": event_type,
+                "correlation_id": correlation_id,
+            }
+            if orjson is not None:
+                if payload:
+                    record["payload"] = payload
+                if metadata:
+                    record["metadata"] = metadata
+                option = orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
+                if self.sort_keys:
+                    option |= orjson.OPT_SORT_KEYS
+                chunks.append(orjson.dumps(record, default=_json_default, option=option))
+            else:
+                if payload:
+                    record["payload"] = _normalise_mapping(payload)
+                if metadata:
+                    record["metadata"] = _normalise_mapping(metadata)
+                serialised = json.dumps(
+                    record,
+                    ensure_ascii=False,
+                    sort_keys=self.sort_keys,
+                    default=_json_default,
+                )
+                chunks.append(serialised.encode("utf-8") + b"\n")
+            records.append(record)
+
+        if chunks:
+            buf = b"".join(chunks)
+            with self._lock:
+                self._ensure_handle().write(buf)
+        return records
+
+    def flush(self) -> None:
+        """Flush buffered entries to the underlying file."""
 
         with self._lock:
-            with self.path.open("a", encoding="utf-8") as handle:
-                handle.write(serialised)
-                handle.write("\n")
-        return record
+            if self._handle is not None:
+                self._handle.flush()
+
+    def close(self) -> None:
+        """Flush and close the append handle; reopened lazily on next write."""
+
+        with self._lock:
+            if self._handle is not None:
+                self._handle.close()
+                self._handle = None
 
     def iter_entries(self, limit: Optional[int] = None) -> Iterator[LedgerRecord]:
         """Yield recorded entries, preserving insertion order."""
 
+        self.flush()
         if not self.path.exists():
             return
 
+        loads = json.loads if orjson is None else orjson.loads
         count = 0
-        with self.path.open("r", encoding="utf-8") as handle:
-            for line in handle:
+        # Binary iteration skips text-mode decoding/newline translation; both
+        # parsers accept raw lines with surrounding whitespace so no per-line
+        # strip is needed beyond the blank-line check.
+        with self.path.open("rb") as handle:
+            for raw in handle:
                 if limit is not None and count >= limit:
                     break
-                line = line.strip()
-                if not line:
+                if raw.isspace() or not raw:
                     continue
                 count += 1
-                yield LedgerRecord(json.loads(line))
+                yield loads(raw)
 
     def tail(self, limit: int = 10) -> Iterable[LedgerRecord]:
-        """Return the most recent *limit* records."""
+        """Return the most recent *limit* records.
+
+        Only the tail block of the file is read and decoded, so the cost is
+        bounded by ``limit`` rather than the full ledger history.
+        """
+
+        self.flush()
+        if limit <= 0 or not self.path.exists():
+            return []
 
-        entries = list(self.iter_entries())
-        return entries[-limit:]
+        loads = json.loads if orjson is None else orjson.loads
+        lines = [line for line in self._tail_bytes(limit).split(b"\n") if line.strip()]
+        return [loads(line) for line in lines[-limit:]]
+
+    def _tail_bytes(self, limit: int, chunk_size: int = 65536) -> bytes:
+        """Read backwards from EOF until *limit* non-blank lines are buffered.
+
+        The budget counts only non-blank lines: blank separator lines carry
+        no records, so counting raw newlines would stop reading early and
+        return fewer than *limit* records even when older ones exist. One
+        extra line beyond the budget is required so the oldest buffered line,
+        which may be a partial read, can be discarded by the caller.
+        """
+
+        buffer = bytearray()
+        with self.path.open("rb") as handle:
+            position = handle.seek(0, os.SEEK_END)
+            while position > 0:
+                if sum(1 for line in buffer.split(b"\n") if line.strip()) > limit:
+                    break
+                step = min(chunk_size, position)
+                position -= step
+                handle.seek(position)
+                buffer[:0] = handle.read(step)
+        return bytes(buffer)
 
     def clear(self) -> None:
         """Erase the ledger contents while preserving the file."""
 
         with self._lock:
+            if self._handle is not None:
+                self._handle.close()
+                self._handle = None
             self.path.write_text("", encoding="utf-8")
 
 
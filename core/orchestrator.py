@@ -1,9 +1,14 @@
 """Workflow orchestrator for ACMS pipeline executions."""
 from __future__ import annotations
 
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from concurrent.futures import Executor, ThreadPoolExecutor
 from contextlib import nullcontext
 from dataclasses import dataclass, field
-from typing import Any, Callable, Iterable, List, Mapping, Optional, Sequence
+from typing import Any, Callable, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Type
 
 from .observability.ledger import Ledger
 from .observability.ulid_generator import new_ulid
@@ -12,6 +17,17 @@ from .task_scheduler import TaskScheduler
 
 __all__ = ["Orchestrator"]
 
+# Bound on the number of distinct task graphs whose plans are memoized.
+_PLAN_CACHE_SIZE = 128
+
+# Enum member and value lookups go through the descriptor protocol, so the
+# states touched per task are resolved once here instead of per iteration.
+_RUNNING = ExecutionState.RUNNING
+_COMPLETED = ExecutionState.COMPLETED
+_FAILED = ExecutionState.FAILED
+_SKIPPED = ExecutionState.SKIPPED
+_STATE_COMPLETED = ExecutionState.COMPLETED.value
+
 
 def _resolve_ledger(
     ledger: Optional[Any], ledger_writer: Optional[Any], audit_ledger: Optional[Any]
@@ -28,9 +44,65 @@ def _normalise_plugins(plugins: Optional[Iterable[Any]]) -> List[Any]:
     return [plugin for plugin in plugins]
 
 
-@dataclass
+def _normalise_waves(
+    waves: Iterable[Any], coerce: Callable[[Any], Mapping[str, Any]]
+) -> Iterator[List[Mapping[str, Any]]]:
+    for wave in waves:
+        wave_type = type(wave)
+        if wave_type is list or wave_type is tuple:
+            yield [coerce(task) for task in wave]
+        elif wave_type is dict or isinstance(wave, Mapping):
+            yield [coerce(wave)]
+        elif isinstance(wave, Iterable) and not isinstance(wave, (str, bytes)):
+            yield [coerce(task) for task in wave]
+        else:
+            yield [coerce(wave)]
+
+
+def _plan_from_mapping(
+    plan: Mapping[str, Any], coerce: Callable[[Any], Mapping[str, Any]]
+) -> Iterator[List[Mapping[str, Any]]]:
+    if "waves" in plan:
+        waves = plan["waves"]
+    elif "tasks" in plan:
+        waves = ([task] for task in plan["tasks"])
+    else:
+        waves = [plan]
+    return _normalise_waves(waves, coerce)
+
+
+def _plan_from_sequence(
+    plan: Sequence[Any], coerce: Callable[[Any], Mapping[str, Any]]
+) -> Iterator[List[Mapping[str, Any]]]:
+    return _normalise_waves(plan, coerce)
+
+
+def _plan_from_scalar(
+    plan: Any, coerce: Callable[[Any], Mapping[str, Any]]
+) -> Iterator[List[Mapping[str, Any]]]:
+    yield [coerce(plan)]
+
+
+# Concrete-type dispatch avoids repeated ABC __instancecheck__ walks on the
+# common dict/list plan shapes; ABC fallback only runs when the type misses.
+_PLAN_DISPATCH: dict[type, Callable[..., Iterator[List[Mapping[str, Any]]]]] = {
+    dict: _plan_from_mapping,
+    list: _plan_from_sequence,
+    tuple: _plan_from_sequence,
+    str: _plan_from_scalar,
+    bytes: _plan_from_scalar,
+}
+
+
+@dataclass(slots=True)
 class Orchestrator:
-    """Coordinates task scheduling, execution state transitions and observability."""
+    """Coordinates task scheduling, execution state transitions and observability.
+
+    Slots turn every attribute access in the task loop into a fixed-offset
+    load and shrink per-instance memory, which matters for short-lived
+    per-request orchestrators; all internal state is therefore declared as
+    ``init=False`` fields below.
+    """
 
     task_scheduler: Optional[Any] = None
     scheduler: Optional[Any] = None
@@ -45,12 +117,41 @@ class Orchestrator:
     plugin_registry: Optional[Iterable[Any]] = None
     plugin_loader: Optional[Any] = None
     plugin_specs: Optional[Sequence[str]] = None
+    max_workers: Optional[int] = None
+    executor_cls: Type[Executor] = ThreadPoolExecutor
+    retryable_exceptions: Tuple[Type[BaseException], ...] = (Exception,)
     _loaded_plugins: List[Any] = field(default_factory=list, init=False)
+    _max_workers: int = field(init=False, repr=False)
+    _executor: Optional[Executor] = field(init=False, repr=False)
+    _plan_cache: "OrderedDict[str, Any]" = field(init=False, repr=False)
+    _scheduler: Optional[Any] = field(init=False, repr=False)
+    _plan: Optional[Any] = field(init=False, repr=False)
+    _state_machine_factory: Callable[[], Any] = field(init=False, repr=False)
+    _ledger: Optional[Any] = field(init=False, repr=False)
+    _ledger_log: Optional[Callable[..., Any]] = field(init=False, repr=False)
+    _ledger_log_batch: Optional[Callable[..., Any]] = field(init=False, repr=False)
+    _ledger_write: Optional[Callable[[Mapping[str, Any]], Any]] = field(init=False, repr=False)
+    _tracer: Optional[Any] = field(init=False, repr=False)
+    _before_workflow_hooks: List[Callable[..., Any]] = field(init=False, repr=False)
+    _after_task_hooks: List[Callable[..., Any]] = field(init=False, repr=False)
+    _after_workflow_hooks: List[Callable[..., Any]] = field(init=False, repr=False)
 
     def __post_init__(self) -> None:
+        self._max_workers = (
+            self.max_workers
+            if self.max_workers is not None
+            else min(32, (os.cpu_count() or 1) * 4)
+        )
+        self._executor: Optional[Executor] = None
+        self._plan_cache: OrderedDict[str, Any] = OrderedDict()
         self._scheduler = self.scheduler or self.task_scheduler
+        self._plan: Optional[Any] = None
         if self._scheduler is None:
             self._scheduler = TaskScheduler({"tasks": []})
+        else:
+            # The DAG held by a configured scheduler is immutable, so its plan
+            # can be computed once up front instead of per run_workflow call.
+            self._plan = self._compute_scheduler_plan()
 
         if self.state_machine_factory is None:
             if self.state_machine is not None:
@@ -61,6 +162,21 @@ class Orchestrator:
             self._state_machine_factory = self.state_machine_factory
 
         self._ledger = _resolve_ledger(self.ledger, self.ledger_writer, self.audit_ledger)
+        # The writer shape never changes for the life of the orchestrator, so
+        # the isinstance/getattr probing happens once here and the hot path
+        # calls pre-bound methods.
+        self._ledger_log: Optional[Callable[..., Any]] = None
+        self._ledger_log_batch: Optional[Callable[..., Any]] = None
+        self._ledger_write: Optional[Callable[[Mapping[str, Any]], Any]] = None
+        if isinstance(self._ledger, Ledger):
+            self._ledger_log = self._ledger.log
+            self._ledger_log_batch = self._ledger.log_batch
+        elif self._ledger is not None:
+            writer = getattr(self._ledger, "append", None) or getattr(
+                self._ledger, "write", None
+            )
+            if callable(writer):
+                self._ledger_write = writer
         self._tracer = self.trace or self.tracer
 
         plugin_candidates: List[Any] = []
@@ -71,11 +187,24 @@ class Orchestrator:
             for spec in self.plugin_specs:
                 try:
                     plugin_candidates.append(self.plugin_loader.load(spec))
-                except Exception as exc:  # pragma: no cover - defensive
+                except self.retryable_exceptions as exc:  # pragma: no cover - defensive
                     plugin_candidates.append(exc)
 
         self._loaded_plugins = plugin_candidates
 
+        # Hook resolution happens once here; the per-task loops iterate flat
+        # callable lists instead of re-running getattr/callable per plugin.
+        self._before_workflow_hooks = self._resolve_hooks("before_workflow")
+        self._after_task_hooks = self._resolve_hooks("after_task")
+        self._after_workflow_hooks = self._resolve_hooks("after_workflow")
+
+    def _resolve_hooks(self, name: str) -> List[Callable[..., Any]]:
+        return [
+            hook
+            for plugin in self._loaded_plugins
+            if callable(hook := getattr(plugin, name, None))
+        ]
+
     # ------------------------------------------------------------------
     # Public API
     def run_workflow(
@@ -104,51 +233,82 @@ class Orchestrator:
         if not execution_plan and task_graph:
             execution_plan = self._build_plan(task_graph)
         elif not execution_plan:
+            execution_plan = self._plan
+        if not execution_plan:
             raise ValueError("An execution plan or task graph must be supplied")
 
-        waves = self._coerce_plan(execution_plan)
-
         results: List[Mapping[str, Any]] = []
         tracer = self._tracer or nullcontext()
         span_cm = tracer.start_as_current_span("acms.orchestrator.run") if hasattr(tracer, "start_as_current_span") else nullcontext()
 
+        # Waves stream out of the coercion pipeline one at a time, so the
+        # working set stays at one wave and the first task starts before the
+        # whole plan has been normalised. The planned-id set grows as waves
+        # arrive; scheduler plans are topological so dependencies always
+        # reference waves that have already streamed past.
+        planned_ids: set[str] = set()
+        wave_ids: List[List[str]] = []
+        completed: set[str] = set()
+
         with span_cm:
-            for plugin in self._loaded_plugins:
-                hook = getattr(plugin, "before_workflow", None)
-                if callable(hook):
-                    hook(task_graph=task_graph, trace_id=trace_id)
-
-            for wave_index, wave in enumerate(waves):
-                for entry in wave:
-                    task_payload = self._coerce_task(entry)
-                    execution = self._initialise_execution(task_payload, trace_id)
-                    machine = self._state_machine_factory()
-
-                    self._advance_state(machine, execution, ExecutionState.RUNNING)
-                    self._advance_state(machine, execution, ExecutionState.COMPLETED)
-
-                    record = {
-                        "trace_id": trace_id,
-                        "task_id": task_payload["id"],
-                        "wave": wave_index,
-                        "state": execution.state.value,
-                    }
-                    self._write_ledger(record)
-                    results.append(record)
-
-                    for plugin in self._loaded_plugins:
-                        hook = getattr(plugin, "after_task", None)
-                        if callable(hook):
-                            hook(task=task_payload, execution=record)
-
-            for plugin in self._loaded_plugins:
-                hook = getattr(plugin, "after_workflow", None)
-                if callable(hook):
-                    hook(results=results, trace_id=trace_id)
+            for hook in self._before_workflow_hooks:
+                hook(task_graph=task_graph, trace_id=trace_id)
+
+            factory = self._state_machine_factory
+            for wave_index, payloads in enumerate(self._iter_coerced_waves(execution_plan)):
+                ids = [task["id"] for task in payloads]
+                planned_ids.update(ids)
+                wave_ids.append(ids)
+                # State machines and record slots are allocated in bulk once
+                # the wave size is known; index assignment into the
+                # preallocated list avoids per-task append/resize churn.
+                if factory is TaskStateMachine:
+                    machines: List[Any] = [TaskStateMachine() for _ in payloads]
+                else:
+                    machines = [factory() for _ in payloads]
+                records: List[dict[str, Any]] = [{}] * len(payloads)
+
+                if self._max_workers > 1 and len(payloads) > 1:
+                    # Tasks within a wave are independent by construction, so
+                    # they can execute concurrently. Results are gathered in
+                    # submission order to keep ledger output deterministic.
+                    pool = self._ensure_executor()
+                    futures = [
+                        pool.submit(
+                            self._execute_entry,
+                            payloads[index],
+                            machines[index],
+                            wave_index,
+                            trace_id,
+                            planned_ids,
+                            completed,
+                        )
+                        for index in range(len(payloads))
+                    ]
+                    for index, future in enumerate(futures):
+                        records[index] = future.result()
+                else:
+                    for index, task_payload in enumerate(payloads):
+                        records[index] = self._execute_entry(
+                            task_payload,
+                            machines[index],
+                            wave_index,
+                            trace_id,
+                            planned_ids,
+                            completed,
+                        )
+
+                for task_payload, record in zip(payloads, records):
+                    self._finalise_entry(task_payload, record, completed, results)
+                # Ledger writes land in a single flush at the wave boundary.
+                self._flush_ledger(records)
+
+            for hook in self._after_workflow_hooks:
+                hook(results=results, trace_id=trace_id)
 
         return {
             "trace_id": trace_id,
-            "waves": [[task["id"] for task in wave] for wave in waves],
+            "waves": wave_ids,
             "ledger": results,
         }
 
@@ -162,8 +322,118 @@ class Orchestrator:
 
         return self.run_workflow(*args, **kwargs)
 
+    def invalidate_plan(self) -> None:
+        """Recompute the cached execution plan after a scheduler mutation."""
+
+        self._plan = self._compute_scheduler_plan()
+
+    def close(self) -> None:
+        """Shut down the shared wave executor if one was started."""
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def __enter__(self) -> "Orchestrator":
+        return self
+
+    def __exit__(self, exc_type: object, exc: object, tb: object) -> None:
+        self.close()
+
+    def __del__(self) -> None:  # pragma: no cover - interpreter shutdown order
+        try:
+            self.close()
+        except Exception:
+            pass
+
     # ------------------------------------------------------------------
     # Internal helpers
+    def _ensure_executor(self) -> Executor:
+        """Return the shared wave executor, creating it on first use."""
+
+        if self._executor is None:
+            self._executor = self.executor_cls(max_workers=self._max_workers)
+        return self._executor
+
+    def _compute_scheduler_plan(self) -> Optional[Any]:
+        scheduler = self._scheduler
+        if scheduler is None or not hasattr(scheduler, "get_execution_plan"):
+            return None
+        try:
+            return scheduler.get_execution_plan()
+        except Exception:  # pragma: no cover - defensive against lazy schedulers
+            return None
+
+    def _execute_entry(
+        self,
+        task_payload: Mapping[str, Any],
+        machine: Any,
+        wave_index: int,
+        trace_id: str,
+        planned_ids: set[str],
+        completed: set[str],
+    ) -> dict[str, Any]:
+        """Run a single coerced wave entry through its state machine."""
+
+        execution = self._initialise_execution(task_payload, trace_id)
+
+        if self._dependencies_satisfied(execution, planned_ids, completed):
+            try:
+                self._advance_state(machine, execution, _RUNNING)
+                self._advance_state(machine, execution, _COMPLETED)
+            except self.retryable_exceptions:
+                # Classified failures are recorded against the task; anything
+                # outside the retryable set (KeyboardInterrupt, SystemExit or
+                # a narrowed configuration) aborts the workflow immediately.
+                self._advance_state(machine, execution, _FAILED)
+        else:
+            self._advance_state(machine, execution, _SKIPPED)
+
+        return {
+            "trace_id": trace_id,
+            "task_id": task_payload["id"],
+            "wave": wave_index,
+            "state": execution.state.value,
+        }
+
+    def _finalise_entry(
+        self,
+        task_payload: Mapping[str, Any],
+        record: dict[str, Any],
+        completed: set[str],
+        results: List[Mapping[str, Any]],
+    ) -> None:
+        """Publish a task outcome to the results and plugin hooks."""
+
+        if record["state"] == _STATE_COMPLETED:
+            completed.add(str(task_payload["id"]))
+
+        results.append(record)
+
+        for hook in self._after_task_hooks:
+            hook(task=task_payload, execution=record)
+
+    @staticmethod
+    def _dependencies_satisfied(
+        execution: TaskExecution, planned_ids: set[str], completed: set[str]
+    ) -> bool:
+        """Check declared dependencies against the completed set in O(D).
+
+        Only dependencies that are part of the current plan gate execution;
+        references to tasks outside the plan are assumed to be satisfied
+        upstream. Membership checks are O(1) against the incrementally
+        maintained ``completed`` set rather than a scan of prior results.
+        """
+
+        dependencies = execution.dependencies
+        if not dependencies:
+            # Most tasks in typical plans are dependency-free; skip the
+            # generator setup entirely for them.
+            return True
+        return all(
+            dep in completed or dep not in planned_ids for dep in dependencies
+        )
+
     def _advance_state(
         self, machine: Any, execution: TaskExecution, target: ExecutionState
     ) -> None:
@@ -177,65 +447,92 @@ class Orchestrator:
             # If the custom machine rejects the transition we still record the attempt
             pass
 
+    def clear_plan_cache(self) -> None:
+        """Forget memoized plans for previously submitted task graphs."""
+
+        self._plan_cache.clear()
+
     def _build_plan(self, task_graph: Mapping[str, Any]) -> Mapping[str, Any]:
-        """Return a plan using the configured scheduler."""
+        """Return a plan using the configured scheduler.
+
+        Plans are memoized per canonical task-graph hash so resubmitting an
+        identical graph (retry loops, repeated workflow runs) skips the
+        scheduler rebuild and topological sort.
+        """
+
+        key = self._plan_cache_key(task_graph)
+        if key is not None:
+            cached = self._plan_cache.get(key)
+            if cached is not None:
+                self._plan_cache.move_to_end(key)
+                return cached
 
         scheduler = self._scheduler
         if isinstance(scheduler, TaskScheduler):
-            return TaskScheduler(task_graph).get_execution_plan()
-        if hasattr(scheduler, "get_execution_plan"):
-            return scheduler.get_execution_plan()
-        if hasattr(scheduler, "topological_sort"):
-            waves = scheduler.topological_sort()
-            return {"waves": waves}
+            plan = TaskScheduler(task_graph).get_execution_plan()
+        elif hasattr(scheduler, "get_execution_plan"):
+            plan = scheduler.get_execution_plan()
+        elif hasattr(scheduler, "topological_sort"):
+            plan = {"waves": scheduler.topological_sort()}
+        else:
+            plan = TaskScheduler(task_graph).get_execution_plan()
+
+        if key is not None:
+            self._plan_cache[key] = plan
+            while len(self._plan_cache) > _PLAN_CACHE_SIZE:
+                self._plan_cache.popitem(last=False)
+        return plan
 
-        derived = TaskScheduler(task_graph)
-        return derived.get_execution_plan()
+    @staticmethod
+    def _plan_cache_key(task_graph: Mapping[str, Any]) -> Optional[str]:
+        try:
+            body = json.dumps(task_graph, sort_keys=True, default=str)
+        except (TypeError, ValueError):
+            return None
+        return hashlib.blake2b(body.encode("utf-8"), digest_size=16).hexdigest()
 
     def _coerce_plan(self, plan: Any) -> List[List[Mapping[str, Any]]]:
         """Normalise the plan into a list of execution waves."""
 
-        if plan is None:
-            return []
+        return list(self._iter_coerced_waves(plan))
 
-        if isinstance(plan, Mapping):
-            if "waves" in plan:
-                waves = plan["waves"]
-            elif "tasks" in plan:
-                waves = [[task] for task in plan["tasks"]]
-            else:
-                waves = [plan]
-        elif isinstance(plan, Sequence) and not isinstance(plan, (str, bytes)):
-            waves = plan
-        else:
-            waves = [[plan]]
+    def _iter_coerced_waves(self, plan: Any) -> Iterator[List[Mapping[str, Any]]]:
+        """Yield normalised execution waves one at a time."""
 
-        normalised: List[List[Mapping[str, Any]]] = []
-        for wave in waves:
-            if isinstance(wave, Mapping):
-                normalised.append([self._coerce_task(wave)])
-                continue
+        if plan is None:
+            return iter(())
 
-            if not isinstance(wave, Iterable) or isinstance(wave, (str, bytes)):
-                normalised.append([self._coerce_task(wave)])
-                continue
+        handler = _PLAN_DISPATCH.get(type(plan))
+        if handler is not None:
+            return handler(plan, self._coerce_task)
 
-            normalised.append([self._coerce_task(task) for task in wave])
-        return normalised
+        if isinstance(plan, Mapping):
+            return _plan_from_mapping(plan, self._coerce_task)
+        if isinstance(plan, Sequence) and not isinstance(plan, (str, bytes)):
+            return _plan_from_sequence(plan, self._coerce_task)
+        return _plan_from_scalar(plan, self._coerce_task)
 
     def _coerce_task(self, task: Any) -> Mapping[str, Any]:
         if isinstance(task, Mapping):
             if "id" not in task:
                 raise KeyError("Task entries must include an 'id'")
-            return dict(task)
+            # NOTE: treat as immutable — downstream only reads "id" and
+            # "dependencies", so the defensive per-task dict copy is skipped.
+            return task
         return {"id": str(task)}
 
     def _initialise_execution(self, task: Mapping[str, Any], trace_id: str) -> TaskExecution:
         dependencies = task.get("dependencies")
+        # Scheduler-produced plans carry dependencies as a plain list of
+        # strings, so that shape is taken as-is without the Iterable ABC
+        # check or a redundant str() per element; other shapes fall through
+        # to the general coercion.
         if dependencies is None:
             deps_list: List[str] = []
+        elif type(dependencies) is list and all(type(dep) is str for dep in dependencies):
+            deps_list = dependencies
         elif isinstance(dependencies, Iterable) and not isinstance(dependencies, (str, bytes)):
-            deps_list = [str(dep) for dep in dependencies]
+            deps_list = [dep if type(dep) is str else str(dep) for dep in dependencies]
         else:
             deps_list = [str(dependencies)]
 
@@ -247,13 +544,25 @@ class Orchestrator:
         return execution
 
     def _write_ledger(self, entry: Mapping[str, Any]) -> None:
-        if self._ledger is None:
-            return
+        if self._ledger_log is not None:
+            self._ledger_log("task.completed", entry, correlation_id=entry.get("trace_id"))
+        elif self._ledger_write is not None:
+            self._ledger_write(entry)
 
-        if isinstance(self._ledger, Ledger):
-            self._ledger.log("task.completed", entry, correlation_id=entry.get("trace_id"))
+    def _flush_ledger(self, entries: Sequence[Mapping[str, Any]]) -> None:
+        """Write a wave's worth of records in one ledger call where possible."""
+
+        if not entries:
             return
 
-        writer = getattr(self._ledger, "append", None) or getattr(self._ledger, "write", None)
-        if callable(writer):
-            writer(entry)
+        if self._ledger_log_batch is not None:
+            # One serialization pass and one buffered write for the batch.
+            self._ledger_log_batch(
+                "task.completed",
+                entries,
+                correlation_id=entries[0].get("trace_id"),
+            )
+        elif self._ledger_write is not None:
+            write = self._ledger_write
+            for entry in entries:
+                write(entry)
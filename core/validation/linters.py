@@ -1,15 +1,206 @@
 """Utilities for running lint tools as part of the validation gates."""
 from __future__ import annotations
 
+import functools
+import os
+import selectors
 import shutil
 import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Iterable, Mapping, MutableMapping, Sequence
+from types import MappingProxyType
+from typing import Iterable, List, Mapping, Optional, Sequence
 
-__all__ = ["LintResult", "LintRunner"]
+__all__ = ["LintResult", "LintRunner", "DEFAULT_LINT_RUNNER"]
 
+# Below this many paths a single invocation is cheapest; above it the path
+# set is striped across ~cpu_count processes so tool start-up cost is
+# amortised and no single argv approaches ARG_MAX.
+_BATCH_MIN = 64
 
-@dataclass(frozen=True)
+# Daemonised front-ends for tools whose start-up cost dominates: dmypy keeps
+# the type-checking server alive between invocations, so repeat gate runs pay
+# an RPC instead of a full interpreter plus cache load. Used only when the
+# daemon binary is actually on PATH; otherwise the plain tool runs as before.
+_DAEMON_COMMANDS: Mapping[str, Sequence[str]] = {
+    "mypy": ("dmypy", "run", "--"),
+}
+
+# Captured output is capped per stream; verbose tools on big repositories can
+# emit far more than the gate log ever uses. The pipe keeps being drained past
+# the cap so the child never blocks on a full buffer.
+_MAX_CAPTURE = 1 << 20
+_TRUNCATION_MARKER = "\n... [truncated]"
+_READ_SIZE = 1 << 16
+
+
+def _bounded_decode(data: bytes) -> str:
+    """Decode ``data`` truncating past the capture cap."""
+
+    if len(data) <= _MAX_CAPTURE:
+        return data.decode("utf-8", "replace")
+    return data[:_MAX_CAPTURE].decode("utf-8", "replace") + _TRUNCATION_MARKER
+
+
+def _capture_process(
+    command: Sequence[str], cwd: Optional[str] = None
+) -> tuple[int, str, str]:
+    """Run ``command`` streaming stdout/stderr into bounded buffers.
+
+    The selector loop below works on pipe file descriptors, which Windows'
+    SelectSelector cannot poll (sockets only), so that platform falls back
+    to subprocess.run with post-hoc truncation instead.
+    """
+
+    if sys.platform == "win32":  # pragma: no cover - exercised on Windows only
+        completed = subprocess.run(command, capture_output=True, cwd=cwd)
+        return (
+            completed.returncode,
+            _bounded_decode(completed.stdout),
+            _bounded_decode(completed.stderr),
+        )
+
+    proc = subprocess.Popen(
+        command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, cwd=cwd
+    )
+    assert proc.stdout is not None and proc.stderr is not None
+    buffers = {proc.stdout.fileno(): bytearray(), proc.stderr.fileno(): bytearray()}
+    truncated = {fd: False for fd in buffers}
+    selector = selectors.DefaultSelector()
+    selector.register(proc.stdout, selectors.EVENT_READ)
+    selector.register(proc.stderr, selectors.EVENT_READ)
+    open_streams = 2
+    while open_streams:
+        for key, _ in selector.select():
+            fd = key.fileobj.fileno()  # type: ignore[union-attr]
+            chunk = os.read(fd, _READ_SIZE)
+            if not chunk:
+                selector.unregister(key.fileobj)
+                open_streams -= 1
+                continue
+            buffer = buffers[fd]
+            room = _MAX_CAPTURE - len(buffer)
+            if room >= len(chunk):
+                buffer += chunk
+            elif room > 0:
+                buffer += chunk[:room]
+                truncated[fd] = True
+            else:
+                # Past the cap: discard but keep draining the pipe.
+                truncated[fd] = True
+    selector.close()
+    returncode = proc.wait()
+    stdout = buffers[proc.stdout.fileno()].decode("utf-8", "replace")
+    stderr = buffers[proc.stderr.fileno()].decode("utf-8", "replace")
+    if truncated[proc.stdout.fileno()]:
+        stdout += _TRUNCATION_MARKER
+    if truncated[proc.stderr.fileno()]:
+        stderr += _TRUNCATION_MARKER
+    proc.stdout.close()
+    proc.stderr.close()
+    return returncode, stdout, stderr
+
+
+def _canonicalize_paths(paths: Iterable[str]) -> List[str]:
+    """Resolve, sort and prefix-deduplicate ``paths``.
+
+    A path nested under another supplied path is dropped so the tool never
+    scans the same files twice (e.g. ``["src", "src/foo"]`` collapses to
+    ``["src"]``). Sorting keeps the resulting argv deterministic.
+    """
+
+    resolved = sorted({os.path.abspath(path) for path in paths})
+    kept: List[str] = []
+    for path in resolved:
+        if kept and path.startswith(kept[-1] + os.sep):
+            continue
+        kept.append(path)
+    return kept
+
+
+# Directory names that never contain lintable sources; pruning them here
+# saves every tool its own walk-and-ignore pass over the same trees.
+_SKIP_DIRS = frozenset(
+    {".git", "__pycache__", ".venv", "node_modules", ".mypy_cache", ".ruff_cache", ".runs"}
+)
+
+
+def _expand_paths(paths: Iterable[str]) -> List[str]:
+    """Expand directories in ``paths`` to their ``.py`` files.
+
+    Walks with ``os.scandir`` (DirEntry.is_dir needs no extra stat), prunes
+    cache and VCS directories, and returns a sorted file list that callers
+    can enumerate once and share across every tool instead of letting each
+    tool re-walk the tree.
+    """
+
+    files: List[str] = []
+    stack: List[str] = []
+    for path in _canonicalize_paths(paths):
+        if os.path.isdir(path):
+            stack.append(path)
+        else:
+            files.append(path)
+    while stack:
+        current = stack.pop()
+        try:
+            entries = list(os.scandir(current))
+        except OSError:
+            continue
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in _SKIP_DIRS:
+                        stack.append(entry.path)
+                elif entry.name.endswith(".py"):
+                    files.append(entry.path)
+            except OSError:
+                continue
+    files.sort()
+    return files
+
+
+@functools.lru_cache(maxsize=64)
+def _resolve_binary(name: str, path_env: str) -> Optional[str]:
+    """Resolve ``name`` on PATH once per (binary, PATH) pair.
+
+    Keying on the PATH string keeps the cache correct if the environment is
+    mutated between gate runs; returning the absolute path also lets callers
+    skip the kernel's own PATH walk at exec time.
+    """
+
+    return shutil.which(name, path=path_env or None)
+
+
+def _run_batched(
+    prefix: Sequence[str], paths: Sequence[str], cwd: Optional[str] = None
+) -> tuple[bool, str, str]:
+    """Run ``prefix`` over ``paths``, chunking large path sets in parallel.
+
+    Returns ``(succeeded, stdout, stderr)`` where success requires every
+    chunk's process to exit zero and the streams are concatenated in chunk
+    order so output stays deterministic.
+    """
+
+    def _invoke(chunk: List[str]) -> tuple[int, str, str]:
+        return _capture_process([*prefix, *chunk], cwd=cwd)
+
+    if len(paths) <= _BATCH_MIN:
+        returncode, stdout, stderr = _invoke(list(paths))
+        return returncode == 0, stdout, stderr
+
+    workers = min(os.cpu_count() or 1, max(1, len(paths) // _BATCH_MIN))
+    chunks = [list(paths[offset::workers]) for offset in range(workers)]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(_invoke, chunks))
+    succeeded = all(returncode == 0 for returncode, _, _ in results)
+    stdout = "".join(out for _, out, _ in results)
+    stderr = "".join(err for _, _, err in results)
+    return succeeded, stdout, stderr
+
+
+@dataclass(frozen=True, slots=True)
 class LintResult:
     """Outcome of executing a single lint tool."""
 
@@ -32,13 +223,40 @@ class LintRunner:
     def __init__(
         self,
         tools: Mapping[str, Sequence[str]] | None = None,
+        repo_root: "str | os.PathLike[str] | None" = None,
     ) -> None:
-        self._tools: MutableMapping[str, Sequence[str]] = dict(tools or _DEFAULT_TOOLS)
+        # The default table is an immutable module-level proxy shared by
+        # every runner; only caller-supplied mappings are copied.
+        self._tools: Mapping[str, Sequence[str]] = (
+            dict(tools) if tools is not None else _DEFAULT_TOOLS
+        )
+        # Pinning the working directory keeps the tools' incremental caches
+        # (.ruff_cache, .mypy_cache, pylint statistics) stable no matter
+        # where the caller happens to run from.
+        self._cwd: Optional[str] = None if repo_root is None else str(repo_root)
+        # The table never mutates after construction, so the sorted name
+        # tuple is computed once instead of per available_tools() call.
+        self._tool_names: tuple[str, ...] = tuple(sorted(self._tools))
 
     def available_tools(self) -> Sequence[str]:
         """Return the configured tool names."""
 
-        return tuple(sorted(self._tools))
+        return self._tool_names
+
+    def is_available(self, tool: str) -> bool:
+        """Return ``True`` when ``tool`` (or its daemon front-end) is on PATH.
+
+        An unconfigured tool name raises :class:`KeyError`, matching
+        :meth:`run`: misconfiguration is a caller bug, not a missing binary.
+        """
+
+        if tool not in self._tools:
+            raise KeyError(f"Unknown lint tool: {tool}")
+        path_env = os.environ.get("PATH", "")
+        daemon = _DAEMON_COMMANDS.get(tool)
+        if daemon is not None and _resolve_binary(daemon[0], path_env) is not None:
+            return True
+        return _resolve_binary(self._tools[tool][0], path_env) is not None
 
     def run(self, tool: str, paths: Iterable[str]) -> LintResult:
         """Execute ``tool`` for the provided ``paths`` returning a :class:`LintResult`."""
@@ -46,30 +264,67 @@ class LintRunner:
         if tool not in self._tools:
             raise KeyError(f"Unknown lint tool: {tool}")
 
-        command = list(self._tools[tool]) + list(paths)
-        binary = command[0]
-        if shutil.which(binary) is None:
-            raise FileNotFoundError(f"Required lint tool '{binary}' not found on PATH")
+        prefix = list(self._tools[tool])
+        path_list = _canonicalize_paths(paths)
+        path_env = os.environ.get("PATH", "")
 
-        completed = subprocess.run(
-            command,
-            capture_output=True,
-            text=True,
-            check=False,
-        )
+        daemon = _DAEMON_COMMANDS.get(tool)
+        daemon_path = _resolve_binary(daemon[0], path_env) if daemon else None
+        if daemon is not None and daemon_path is not None:
+            prefix = [daemon_path, *daemon[1:]]
+        else:
+            binary = prefix[0]
+            resolved = _resolve_binary(binary, path_env)
+            if resolved is None:
+                raise FileNotFoundError(f"Required lint tool '{binary}' not found on PATH")
+            prefix[0] = resolved
+
+        succeeded, stdout, stderr = _run_batched(prefix, path_list, cwd=self._cwd)
 
         return LintResult(
             tool=tool,
-            command=tuple(command),
-            succeeded=completed.returncode == 0,
-            stdout=completed.stdout,
-            stderr=completed.stderr,
+            command=tuple(prefix + path_list),
+            succeeded=succeeded,
+            stdout=stdout,
+            stderr=stderr,
         )
 
+    def run_many(
+        self, tools: Sequence[str], paths: Iterable[str]
+    ) -> List[LintResult]:
+        """Run several tools concurrently over the same ``paths``.
 
-_DEFAULT_TOOLS: Mapping[str, Sequence[str]] = {
-    "black": ("black", "--check"),
-    "ruff": ("ruff", "check"),
-    "mypy": ("mypy",),
-    "pylint": ("pylint",),
-}
+        The parent side is blocked on child processes, so the tools are
+        dispatched on a thread pool and results returned in ``tools`` order;
+        wall time approaches the slowest tool instead of the sum. Errors from
+        an individual tool (unknown name, missing binary) propagate exactly
+        as they would from :meth:`run`.
+        """
+
+        tool_list = list(tools)
+        path_list = _canonicalize_paths(paths)
+        if len(tool_list) <= 1:
+            return [self.run(tool, path_list) for tool in tool_list]
+        with ThreadPoolExecutor(
+            max_workers=min(len(tool_list), os.cpu_count() or 1)
+        ) as pool:
+            futures = [pool.submit(self.run, tool, path_list) for tool in tool_list]
+            return [future.result() for future in futures]
+
+
+# Cache directories are pinned under .runs/.cache so repeat invocations hit
+# the tools' incremental caches regardless of caller environment, and CI can
+# persist the whole tree between jobs.
+_DEFAULT_TOOLS: Mapping[str, Sequence[str]] = MappingProxyType(
+    {
+        "black": ("black", "--check"),
+        "ruff": ("ruff", "check", "--cache-dir", ".runs/.cache/ruff"),
+        "mypy": ("mypy", "--cache-dir", ".runs/.cache/mypy"),
+        "pylint": ("pylint", "--persistent=yes"),
+    }
+)
+
+# Shared instance for callers that need no custom tool table; reusing it
+# keeps per-process state such as the resolved-binary cache warm across gate
+# invocations.
+DEFAULT_LINT_RUNNER = LintRunner()
@@ -1,15 +1,17 @@
 """Security scanning helpers for validation workflows."""
 from __future__ import annotations
 
-import shutil
-import subprocess
+import os
 from dataclasses import dataclass
-from typing import Iterable, Mapping, MutableMapping, Sequence
+from types import MappingProxyType
+from typing import Iterable, Mapping, Sequence
 
-__all__ = ["SecurityResult", "SecurityScanner"]
+from .linters import _canonicalize_paths, _resolve_binary, _run_batched
 
+__all__ = ["SecurityResult", "SecurityScanner", "DEFAULT_SECURITY_SCANNER"]
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class SecurityResult:
     """Result of running an individual security scanner."""
 
@@ -32,13 +34,38 @@ class SecurityScanner:
     def __init__(
         self,
         tools: Mapping[str, Sequence[str]] | None = None,
+        repo_root: "str | os.PathLike[str] | None" = None,
     ) -> None:
-        self._tools: MutableMapping[str, Sequence[str]] = dict(tools or _DEFAULT_TOOLS)
+        # The default table is an immutable module-level proxy shared by
+        # every scanner; only caller-supplied mappings are copied.
+        self._tools: Mapping[str, Sequence[str]] = (
+            dict(tools) if tools is not None else _DEFAULT_TOOLS
+        )
+        # The table never mutates after construction, so the sorted name
+        # tuple is computed once instead of per available_tools() call.
+        self._tool_names: tuple[str, ...] = tuple(sorted(self._tools))
+        # Mirrors LintRunner: a pinned working directory keeps tool caches
+        # stable across invocations from different callers.
+        self._cwd = None if repo_root is None else str(repo_root)
 
     def available_tools(self) -> Sequence[str]:
         """Return the configured tool names."""
 
-        return tuple(sorted(self._tools))
+        return self._tool_names
+
+    def is_available(self, tool: str) -> bool:
+        """Return ``True`` when ``tool``'s binary is on PATH.
+
+        An unconfigured tool name raises :class:`KeyError`, matching
+        :meth:`run`: misconfiguration is a caller bug, not a missing binary.
+        """
+
+        if tool not in self._tools:
+            raise KeyError(f"Unknown security tool: {tool}")
+        return (
+            _resolve_binary(self._tools[tool][0], os.environ.get("PATH", ""))
+            is not None
+        )
 
     def run(self, tool: str, paths: Iterable[str]) -> SecurityResult:
         """Execute ``tool`` with ``paths`` returning a :class:`SecurityResult`."""
@@ -46,28 +73,32 @@ class SecurityScanner:
         if tool not in self._tools:
             raise KeyError(f"Unknown security tool: {tool}")
 
-        command = list(self._tools[tool]) + list(paths)
-        binary = command[0]
-        if shutil.which(binary) is None:
+        prefix = list(self._tools[tool])
+        path_list = _canonicalize_paths(paths)
+        binary = prefix[0]
+        resolved = _resolve_binary(binary, os.environ.get("PATH", ""))
+        if resolved is None:
             raise FileNotFoundError(f"Required security tool '{binary}' not found on PATH")
+        prefix[0] = resolved
 
-        completed = subprocess.run(
-            command,
-            capture_output=True,
-            text=True,
-            check=False,
-        )
+        succeeded, stdout, stderr = _run_batched(prefix, path_list, cwd=self._cwd)
 
         return SecurityResult(
             tool=tool,
-            command=tuple(command),
-            succeeded=completed.returncode == 0,
-            stdout=completed.stdout,
-            stderr=completed.stderr,
+            command=tuple(prefix + path_list),
+            succeeded=succeeded,
+            stdout=stdout,
+            stderr=stderr,
         )
 
 
-_DEFAULT_TOOLS: Mapping[str, Sequence[str]] = {
-    "bandit": ("bandit", "-q", "-r"),
-    "gitleaks": ("gitleaks", "detect", "--no-banner"),
-}
+_DEFAULT_TOOLS: Mapping[str, Sequence[str]] = MappingProxyType(
+    {
+        "bandit": ("bandit", "-q", "-r"),
+        "gitleaks": ("gitleaks", "detect", "--no-banner"),
+    }
+)
+
+# Shared instance mirroring DEFAULT_LINT_RUNNER so per-process caches stay
+# warm across gate invocations.
+DEFAULT_SECURITY_SCANNER = SecurityScanner()
@@ -7,6 +7,8 @@ Owner: Platform.Engineering
 
 from __future__ import annotations
 
+import os
+import re
 import subprocess
 from dataclasses import dataclass
 from pathlib import Path
@@ -17,7 +19,19 @@ class WorktreeManagerError(RuntimeError):
     """Raised when git worktree operations fail or are misused."""
 
 
-@dataclass(frozen=True)
+# One compiled scan over the whole porcelain buffer replaces per-line
+# splitting and partitioning. HEAD and branch are optional so bare and
+# detached records still parse; extra attribute lines (locked, prunable)
+# fall outside the match and are ignored exactly as before.
+_WORKTREE_RECORD_RE = re.compile(
+    r"^worktree (?P<worktree>[^\n]+)$"
+    r"(?:\nHEAD (?P<head>[0-9a-f]+)$)?"
+    r"(?:\n(?:branch (?P<branch>[^\n]+)|detached)$)?",
+    re.MULTILINE,
+)
+
+
+@dataclass(frozen=True, slots=True)
 class WorktreeInfo:
     """Metadata describing a configured git worktree."""
 
@@ -41,6 +55,13 @@ class WorktreeManager:
     def __init__(self, repo_root: Path) -> None:
         self.repo_root = Path(repo_root).resolve()
         self._validate_repository()
+        # Path set for worktree_exists, keyed by the mtime generation of
+        # .git/worktrees: adding or removing a worktree creates or deletes a
+        # subdirectory there, so the set of paths is exactly what the
+        # fingerprint tracks. Branch and revision data is deliberately not
+        # cached — refs advance without touching the directory's mtime, so
+        # list_worktrees() always re-parses.
+        self._worktree_cache: Optional[tuple[tuple[int, int], frozenset[Path]]] = None
 
     def _validate_repository(self) -> None:
         git_dir = self.repo_root / ".git"
@@ -69,31 +90,72 @@ class WorktreeManager:
                 f"git command failed: {' '.join(command)}\n{exc.stdout or ''}{exc.stderr or ''}"
             ) from exc
 
+    def _run_git_raw(self, *args: str) -> str:
+        """Run git capturing stdout straight off the pipe.
+
+        Bypasses subprocess.run's text-mode buffering: chunks are read with
+        ``os.read`` and decoded once at the end, avoiding the intermediate
+        text-IO copies for commands with large porcelain output.
+        """
+
+        command = ["git", "-C", str(self.repo_root), *args]
+        proc = subprocess.Popen(
+            command, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+        )
+        assert proc.stdout is not None and proc.stderr is not None
+        chunks: list[bytes] = []
+        fd = proc.stdout.fileno()
+        while chunk := os.read(fd, 65536):
+            chunks.append(chunk)
+        stderr = proc.stderr.read()
+        returncode = proc.wait()
+        proc.stdout.close()
+        proc.stderr.close()
+        if returncode != 0:
+            raise WorktreeManagerError(
+                f"git command failed: {' '.join(command)}\n"
+                f"{stderr.decode('utf-8', 'replace')}"
+            )
+        return b"".join(chunks).decode("utf-8")
+
     def list_worktrees(self) -> List[WorktreeInfo]:
-        """Return every configured worktree parsed from porcelain output."""
+        """Return every configured worktree parsed from porcelain output.
 
-        result = self._run_git(
-            "worktree", "list", "--porcelain", capture_output=True
+        Always re-parses: branch and revision change whenever refs advance
+        (a plain commit, or a checkout inside a linked worktree), which no
+        cheap filesystem fingerprint tracks reliably.
+        """
+
+        stdout = self._run_git_raw("worktree", "list", "--porcelain")
+        return [
+            WorktreeInfo(
+                path=Path(match["worktree"]).resolve(),
+                branch=self._normalize_branch(match["branch"]),
+                revision=match["head"] or "",
+            )
+            for match in _WORKTREE_RECORD_RE.finditer(stdout)
+        ]
+
+    def _worktree_generation(self) -> Optional[tuple[int, int]]:
+        """Return an mtime fingerprint for the set of configured worktrees.
+
+        ``.git/worktrees`` gains or loses a subdirectory whenever a worktree
+        is added or removed; repositories without linked worktrees fall back
+        to ``.git/HEAD``. The probe index is part of the fingerprint so the
+        transition between the two states invalidates as well. ``None``
+        disables caching for this call.
+        """
+
+        probes = (
+            self.repo_root / ".git" / "worktrees",
+            self.repo_root / ".git" / "HEAD",
         )
-        entries: List[WorktreeInfo] = []
-        current: dict[str, str] = {}
-        for line in result.stdout.splitlines():
-            if not line.strip():
-                if current:
-                    entries.append(self._build_info(current))
-                    current = {}
+        for index, probe in enumerate(probes):
+            try:
+                return index, os.stat(probe).st_mtime_ns
+            except OSError:
                 continue
-            key, _, value = line.partition(" ")
-            current[key] = value.strip()
-        if current:
-            entries.append(self._build_info(current))
-        return entries
-
-    def _build_info(self, payload: dict[str, str]) -> WorktreeInfo:
-        path = Path(payload["worktree"]).resolve()
-        branch = self._normalize_branch(payload.get("branch"))
-        revision = payload.get("HEAD", "")
-        return WorktreeInfo(path=path, branch=branch, revision=revision)
+        return None
 
     @staticmethod
     def _normalize_branch(raw: Optional[str]) -> Optional[str]:
@@ -107,7 +169,14 @@ class WorktreeManager:
 
     def worktree_exists(self, worktree_path: Path) -> bool:
         worktree_path = Path(worktree_path).resolve()
-        return any(info.path == worktree_path for info in self.list_worktrees())
+        generation = self._worktree_generation()
+        cache = self._worktree_cache
+        if cache is not None and generation is not None and cache[0] == generation:
+            return worktree_path in cache[1]
+        paths = frozenset(info.path for info in self.list_worktrees())
+        if generation is not None:
+            self._worktree_cache = (generation, paths)
+        return worktree_path in paths
 
     def add_worktree(
         self,
@@ -8,6 +8,7 @@ Owner: Platform.Engineering
 from __future__ import annotations
 
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
@@ -36,10 +37,34 @@ def _run_git(
         ) from exc
 
 
-def fetch_remote(repo_root: Path, remote: str = "origin") -> None:
-    """Fetch updates from ``remote`` for the repository at ``repo_root``."""
+def fetch_remote(
+    repo_root: Path, remote: str = "origin", branch: Optional[str] = None
+) -> None:
+    """Fetch updates from ``remote`` for the repository at ``repo_root``.
+
+    When ``branch`` is given only that ref is fetched, blobs are filtered out
+    of the initial transfer (partial clone) and tags are skipped; the exit
+    code then doubles as the remote-branch existence check, saving the
+    separate ``ls-remote`` round-trip.
+    """
 
-    _run_git(repo_root, "fetch", remote)
+    if branch is None:
+        _run_git(repo_root, "fetch", remote)
+        return
+    result = _run_git(
+        repo_root,
+        "fetch",
+        "--filter=blob:none",
+        "--no-tags",
+        remote,
+        branch,
+        capture_output=True,
+        check=False,
+    )
+    if result.returncode != 0:
+        raise WorktreeSyncError(
+            f"Remote branch {remote}/{branch} does not exist or is unreachable"
+        )
 
 
 def ensure_remote_branch(repo_root: Path, remote: str, branch: str) -> None:
@@ -101,16 +126,28 @@ def synchronize_worktree(
     repo_root = Path(repo_root).resolve()
     worktree_path = Path(worktree_path).resolve()
 
+    # The network fetch and the local status check are independent, so they
+    # overlap; the fast status check no longer waits behind a slow fetch. The
+    # targeted fetch also validates the remote branch via its exit code, so
+    # no separate ls-remote round-trip is needed on this path.
     if fetch:
-        fetch_remote(repo_root, remote)
-
-    ensure_remote_branch(repo_root, remote, upstream_branch)
+        if clean_check:
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                fetch_future = executor.submit(
+                    fetch_remote, repo_root, remote, upstream_branch
+                )
+                clean_future = executor.submit(ensure_clean, worktree_path)
+                fetch_future.result()
+                clean_future.result()
+        else:
+            fetch_remote(repo_root, remote, upstream_branch)
+    else:
+        ensure_remote_branch(repo_root, remote, upstream_branch)
+        if clean_check:
+            ensure_clean(worktree_path)
 
     upstream_ref = f"{remote}/{upstream_branch}"
 
-    if clean_check:
-        ensure_clean(worktree_path)
-
     try:
         rebase_onto(worktree_path, upstream_ref)
     except WorktreeSyncError:
@@ -119,9 +156,47 @@ def synchronize_worktree(
         hard_reset(worktree_path, upstream_ref)
 
 
+def _read_packed_ref(git_dir: Path, ref: str) -> Optional[str]:
+    """Scan ``packed-refs`` for ``ref``; return its hash or ``None``."""
+
+    try:
+        packed = (git_dir / "packed-refs").read_text(encoding="utf-8")
+    except OSError:
+        return None
+    for line in packed.splitlines():
+        if line.startswith(("#", "^")):
+            continue
+        sha, _, name = line.partition(" ")
+        if name == ref:
+            return sha
+    return None
+
+
 def current_revision(path: Path) -> str:
-    """Return the ``HEAD`` revision of the worktree at ``path``."""
+    """Return the ``HEAD`` revision of the worktree at ``path``.
 
+    The hash is resolved by reading ``.git/HEAD`` (and the loose or packed
+    ref it points at) directly, which is orders of magnitude cheaper than
+    forking git. Layouts this fast path cannot handle — linked worktrees
+    where ``.git`` is a file, or unusual ref states — fall back to
+    ``git rev-parse``.
+    """
+
+    git_dir = Path(path) / ".git"
+    try:
+        head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+    except OSError:
+        head = ""
+    if head and not head.startswith("ref: "):
+        return head
+    if head:
+        ref = head[5:].strip()
+        try:
+            return (git_dir / ref).read_text(encoding="utf-8").strip()
+        except OSError:
+            sha = _read_packed_ref(git_dir, ref)
+            if sha is not None:
+                return sha
     result = _run_git(path, "rev-parse", "HEAD", capture_output=True)
     return result.stdout.strip()
 
@@ -4,18 +4,9 @@ Version: 1.0.0
 Date: 2025-11-02
 Owner: Platform.Engineering
 
-This conftest.py adds the repository root to sys.path to enable
-imports of the core package from test modules in this directory.
+Repository-root imports for the reference implementations are resolved
+via the ``pythonpath`` setting in ``pytest.ini`` rather than runtime
+sys.path mutation, so this conftest only marks the directory as a
+rootdir anchor for pytest.
 """
 from __future__ import annotations
-
-import sys
-from pathlib import Path
-
-# Add repository root to Python path for core package imports
-repo_root = Path(__file__).resolve().parent.parent
-if str(repo_root) not in sys.path:
-    sys.path.insert(0, str(repo_root))
-
-# Optional: Print confirmation for debugging (remove in production)
-# print(f"✓ Added {repo_root} to sys.path")
@@ -22,11 +22,16 @@ class ExecutionStateMachine:
         if initial_state not in states:
             raise ValueError(f"Initial state {initial_state} not in states")
         self.states = states
+        # frozenset membership is O(1) per check and avoids rebuilding the
+        # default list on every can_transition call.
+        self._allowed = {
+            name: frozenset(defn.get("allowed_transitions", ()))
+            for name, defn in states.items()
+        }
         self.state = initial_state
 
     def can_transition(self, new_state: str) -> bool:
-        allowed = self.states[self.state].get("allowed_transitions", [])
-        return new_state in allowed
+        return new_state in self._allowed[self.state]
 
     def transition(self, new_state: str) -> None:
         if not self.can_transition(new_state):
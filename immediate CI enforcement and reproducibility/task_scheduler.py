@@ -1,5 +1,6 @@
 # core/task_scheduler.py
 from __future__ import annotations
+import heapq
 from typing import Dict, List, Set, Tuple
 
 class CycleError(Exception):
@@ -23,23 +24,24 @@ def topo_sort(tasks: List[dict]) -> List[dict]:
             indeg[t["id"]] += 1
             adj[dep].append(t["id"])
 
-    # Start with nodes of indegree 0
+    # Start with nodes of indegree 0; a heap keyed on (-priority, id) pops
+    # the preferred task in O(log N) instead of re-sorting the whole ready
+    # list after every insertion.
     def sort_key(tid: str):
         prio = by_id[tid].get("priority", 0)
         return (-prio, tid)  # higher prio first, then id asc
 
-    zero = sorted([tid for tid, d in indeg.items() if d == 0], key=sort_key)
+    zero = [sort_key(tid) for tid, d in indeg.items() if d == 0]
+    heapq.heapify(zero)
     out: List[dict] = []
 
     while zero:
-        tid = zero.pop(0)  # pop smallest (most preferred by sort_key)
+        _, tid = heapq.heappop(zero)  # pop smallest (most preferred by sort_key)
         out.append(by_id[tid])
         for nxt in adj[tid]:
             indeg[nxt] -= 1
             if indeg[nxt] == 0:
-                # insert and resort to keep deterministic ordering
-                zero.append(nxt)
-                zero.sort(key=sort_key)
+                heapq.heappush(zero, sort_key(nxt))
 
     if len(out) != len(tasks):
         raise CycleError("Graph has at least one cycle")
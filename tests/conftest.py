@@ -5,20 +5,20 @@ Date: 2025-11-02
 Owner: Platform.Engineering
 
 Shared fixtures and configuration for all test modules.
-Ensures repository root is in sys.path for core package imports.
+Repository-root imports are resolved via the ``pythonpath`` setting in
+``pytest.ini`` rather than runtime sys.path mutation.
 """
 from __future__ import annotations
 
-import sys
 from pathlib import Path
 from typing import Dict, List
 
 import pytest
 
-# Add repository root to Python path for core package imports
-repo_root = Path(__file__).resolve().parent.parent
-if str(repo_root) not in sys.path:
-    sys.path.insert(0, str(repo_root))
+try:  # pragma: no cover - optional xdist-aware fixture sharing
+    from pytest_shared_session_scope import SetupToken, shared_session_scope_json
+except ImportError:  # pragma: no cover - plain session scope fallback
+    shared_session_scope_json = None
 
 
 @pytest.fixture(scope="session")
@@ -27,8 +27,7 @@ def project_root() -> Path:
     return Path(__file__).resolve().parent.parent
 
 
-@pytest.fixture(scope="session")
-def state_machine_definition() -> Dict[str, Dict[str, List[str]]]:
+def _state_machine_definition() -> Dict[str, Dict[str, List[str]]]:
     """Contract-compliant execution states used across integration tests."""
     return {
         "PENDING": {
@@ -58,8 +57,7 @@ def state_machine_definition() -> Dict[str, Dict[str, List[str]]]:
     }
 
 
-@pytest.fixture(scope="session")
-def task_graph_definition() -> Dict[str, object]:
+def _task_graph_definition() -> Dict[str, object]:
     """Minimal DAG mirroring the execution contract for workflow runs."""
     return {
         "version": "1.0.0",
@@ -98,3 +96,32 @@ def task_graph_definition() -> Dict[str, object]:
             },
         ],
     }
+
+
+if shared_session_scope_json is not None:
+    # Under pytest-xdist each worker duplicates session-scoped fixtures; the
+    # shared store computes these JSON-compatible definitions once per run.
+
+    @shared_session_scope_json()
+    def state_machine_definition():
+        initial = yield
+        if initial is SetupToken.FIRST:
+            initial = _state_machine_definition()
+        yield initial
+
+    @shared_session_scope_json()
+    def task_graph_definition():
+        initial = yield
+        if initial is SetupToken.FIRST:
+            initial = _task_graph_definition()
+        yield initial
+
+else:
+
+    @pytest.fixture(scope="session")
+    def state_machine_definition() -> Dict[str, Dict[str, List[str]]]:
+        return _state_machine_definition()
+
+    @pytest.fixture(scope="session")
+    def task_graph_definition() -> Dict[str, object]:
+        return _task_graph_definition()
@@ -0,0 +1,81 @@
+"""
+Context Broker Server Protocol Tests
+Version: 1.0.0
+Date: 2025-11-02
+Owner: Platform.Engineering
+"""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+BROKER = Path(__file__).resolve().parent.parent / "tools" / "context_broker.py"
+
+
+@pytest.fixture()
+def sample_repo(tmp_path: Path) -> Path:
+    root = tmp_path / "repo"
+    (root / "core").mkdir(parents=True)
+    (root / "core" / "alpha.py").write_text("def alpha():\n    return 'scheduler'\n")
+    (root / "core" / "beta.py").write_text("BETA = 42\n")
+    (root / "README.md").write_text("sample repo\n")
+    return root
+
+
+def _serve(root: Path, request_lines: list[str]) -> list[dict[str, object]]:
+    completed = subprocess.run(
+        [sys.executable, str(BROKER), "--root", str(root), "--server"],
+        input="\n".join(request_lines) + "\n",
+        capture_output=True,
+        text=True,
+        check=True,
+        timeout=60,
+    )
+    return [json.loads(line) for line in completed.stdout.splitlines() if line.strip()]
+
+
+def test_server_answers_one_reply_per_request(sample_repo: Path) -> None:
+    requests = [
+        json.dumps({"keywords": ["scheduler"], "out": "manifest_a.json"}),
+        json.dumps({"keywords": ["beta"], "out": "manifest_b.json"}),
+    ]
+
+    replies = _serve(sample_repo, requests)
+
+    assert [reply["status"] for reply in replies] == ["ok", "ok"]
+    for reply, out_name in zip(replies, ("manifest_a.json", "manifest_b.json")):
+        manifest = json.loads((sample_repo / out_name).read_text())
+        assert reply["total_files"] == manifest["total_files"] == len(manifest["files"])
+        assert reply["total_tokens"] == manifest["total_tokens"]
+        paths = {entry["path"] for entry in manifest["files"]}
+        assert {"core/alpha.py", "core/beta.py", "README.md"} <= paths
+
+
+def test_server_reports_errors_without_exiting(sample_repo: Path) -> None:
+    requests = [
+        "this is not json",
+        json.dumps({"keywords": [], "out": "manifest_ok.json"}),
+    ]
+
+    replies = _serve(sample_repo, requests)
+
+    assert replies[0]["status"] == "error"
+    assert replies[0]["message"]
+    # The malformed request must not take the server down: the follow-up
+    # request on the same connection is still answered.
+    assert replies[1]["status"] == "ok"
+    assert (sample_repo / "manifest_ok.json").exists()
+
+
+def test_server_skips_blank_lines(sample_repo: Path) -> None:
+    requests = ["", json.dumps({"out": "manifest.json"}), ""]
+
+    replies = _serve(sample_repo, requests)
+
+    assert len(replies) == 1
+    assert replies[0]["status"] == "ok"
@@ -0,0 +1,108 @@
+"""
+JSONL Ledger Tests
+Version: 1.0.0
+Date: 2025-11-02
+Owner: Platform.Engineering
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from core.observability.ledger import Ledger
+
+
+def _make_ledger(tmp_path: Path, count: int) -> Ledger:
+    ledger = Ledger(tmp_path / "ledger.jsonl")
+    for index in range(count):
+        ledger.log("task_completed", {"index": index})
+    ledger.flush()
+    return ledger
+
+
+def test_tail_returns_most_recent_records(tmp_path: Path) -> None:
+    ledger = _make_ledger(tmp_path, count=25)
+
+    records = list(ledger.tail(limit=5))
+    assert [record["payload"]["index"] for record in records] == [20, 21, 22, 23, 24]
+
+
+def test_tail_spans_multiple_read_chunks(tmp_path: Path) -> None:
+    ledger = _make_ledger(tmp_path, count=50)
+
+    # A tiny chunk size forces many backwards reads, exercising the partial
+    # first-line handling at every chunk boundary.
+    block = ledger._tail_bytes(limit=10, chunk_size=8)
+    lines = [line for line in block.split(b"\n") if line.strip()]
+    assert len(lines) >= 10
+
+    records = list(ledger.tail(limit=10))
+    assert [record["payload"]["index"] for record in records] == list(range(40, 50))
+
+
+def test_tail_with_fewer_records_than_limit(tmp_path: Path) -> None:
+    ledger = _make_ledger(tmp_path, count=3)
+
+    records = list(ledger.tail(limit=100))
+    assert [record["payload"]["index"] for record in records] == [0, 1, 2]
+
+
+def test_tail_skips_blank_separator_lines(tmp_path: Path) -> None:
+    ledger = Ledger(tmp_path / "ledger.jsonl")
+    for index in range(10):
+        ledger.log("task_completed", {"index": index})
+        # Interleave blank separator lines; they carry no records and must
+        # not consume the tail budget.
+        with ledger._lock:
+            ledger._ensure_handle().write(b"\n\n")
+    ledger.flush()
+
+    records = list(ledger.tail(limit=5))
+    assert [record["payload"]["index"] for record in records] == [5, 6, 7, 8, 9]
+
+
+def test_log_batch_appends_one_record_per_payload(tmp_path: Path) -> None:
+    ledger = Ledger(tmp_path / "ledger.jsonl")
+    payloads = [{"index": index} for index in range(4)]
+
+    records = ledger.log_batch(
+        "wave_completed",
+        payloads,
+        correlation_id="run-1",
+        metadata={"wave": 2},
+    )
+    ledger.flush()
+
+    assert len(records) == 4
+    stored = list(ledger.iter_entries())
+    assert [entry["payload"]["index"] for entry in stored] == [0, 1, 2, 3]
+    assert all(entry["event_type"] == "wave_completed" for entry in stored)
+    assert all(entry["correlation_id"] == "run-1" for entry in stored)
+    assert all(entry["metadata"] == {"wave": 2} for entry in stored)
+
+
+def test_log_batch_interleaves_with_single_logs(tmp_path: Path) -> None:
+    ledger = Ledger(tmp_path / "ledger.jsonl")
+    ledger.log("task_started", {"index": 0})
+    ledger.log_batch("task_completed", [{"index": 1}, {"index": 2}])
+    ledger.log("task_started", {"index": 3})
+    ledger.flush()
+
+    stored = list(ledger.iter_entries())
+    assert [entry["payload"]["index"] for entry in stored] == [0, 1, 2, 3]
+
+
+def test_log_batch_with_no_payloads_writes_nothing(tmp_path: Path) -> None:
+    ledger = Ledger(tmp_path / "ledger.jsonl")
+    assert ledger.log_batch("noop", []) == []
+    ledger.flush()
+    assert list(ledger.iter_entries()) == []
+
+
+def test_tail_of_missing_or_empty_ledger(tmp_path: Path) -> None:
+    ledger = Ledger(tmp_path / "ledger.jsonl")
+    assert list(ledger.tail(limit=5)) == []
+
+    ledger.log("task_started", {})
+    ledger.clear()
+    assert list(ledger.tail(limit=5)) == []
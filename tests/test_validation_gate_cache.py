@@ -0,0 +1,170 @@
+"""
+Quality Gate Cache Tests
+Version: 1.0.0
+Date: 2025-11-02
+Owner: Platform.Engineering
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+from core.validation import code_gate
+from core.validation.code_gate import (
+    GateStatus,
+    _gate_cache_key,
+    _hash_path_contents,
+    _load_gate_cache,
+    _store_gate_cache,
+    run_quality_gates,
+)
+from core.validation.linters import LintRunner
+from core.validation.security_scanner import SecurityScanner
+
+
+def test_hash_path_contents_tracks_content_changes(tmp_path: Path) -> None:
+    target = tmp_path / "module.py"
+    target.write_text("VALUE = 1\n")
+
+    before = _hash_path_contents([str(target)])
+    assert len(before) == 1
+
+    target.write_text("VALUE = 2\n")
+    after = _hash_path_contents([str(target)])
+    assert before != after
+
+    # Directories expand to their files; an extra file perturbs the digests.
+    (tmp_path / "extra.py").write_text("EXTRA = 1\n")
+    assert _hash_path_contents([str(tmp_path)]) != after
+
+
+def test_gate_cache_key_distinguishes_gates_and_content(tmp_path: Path) -> None:
+    target = tmp_path / "module.py"
+    target.write_text("VALUE = 1\n")
+    digests = _hash_path_contents([str(target)])
+
+    key = _gate_cache_key("lint:ruff", digests)
+    assert key == _gate_cache_key("lint:ruff", digests)
+    assert key != _gate_cache_key("lint:mypy", digests)
+
+    target.write_text("VALUE = 2\n")
+    assert key != _gate_cache_key("lint:ruff", _hash_path_contents([str(target)]))
+
+
+def test_gate_cache_round_trip_and_corrupt_file(tmp_path: Path) -> None:
+    cache_path = tmp_path / ".cache" / "gate_cache.json"
+    assert _load_gate_cache(cache_path) == {}
+
+    _store_gate_cache(cache_path, {"abc": "passed"})
+    assert _load_gate_cache(cache_path) == {"abc": "passed"}
+
+    cache_path.write_text("not json")
+    assert _load_gate_cache(cache_path) == {}
+
+
+def test_run_quality_gates_reports_cache_hits_as_passed(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    target = tmp_path / "module.py"
+    target.write_text("VALUE = 1\n")
+    runs_root = tmp_path / ".runs"
+
+    runner = LintRunner(tools={"pytool": (sys.executable, "-c", "pass")})
+    monkeypatch.setattr(code_gate, "DEFAULT_LINT_RUNNER", runner)
+
+    def run_gates() -> code_gate.GateReport:
+        suite = run_quality_gates(
+            [str(target)],
+            coverage_percent=100.0,
+            lint_tools=("pytool",),
+            security_tools=(),
+            runs_root=runs_root,
+        )
+        assert suite.passed
+        return suite.reports[0]
+
+    first = run_gates()
+    assert first.status is GateStatus.PASSED
+    assert not first.details.startswith("cached:")
+
+    second = run_gates()
+    assert second.status is GateStatus.PASSED
+    assert second.details.startswith("cached:")
+
+    # Changing the content invalidates the cached verdict.
+    target.write_text("VALUE = 2\n")
+    third = run_gates()
+    assert third.status is GateStatus.PASSED
+    assert not third.details.startswith("cached:")
+
+
+def test_cache_hits_when_scanning_directory_containing_runs_root(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    project = tmp_path / "project"
+    (project / "pkg").mkdir(parents=True)
+    (project / "pkg" / "module.py").write_text("VALUE = 1\n")
+    (project / "__pycache__").mkdir()
+    (project / "__pycache__" / "junk.pyc").write_bytes(b"\x00junk")
+    runs_root = project / "runs_out"
+
+    runner = LintRunner(tools={"pytool": (sys.executable, "-c", "pass")})
+    monkeypatch.setattr(code_gate, "DEFAULT_LINT_RUNNER", runner)
+
+    def run_gates() -> code_gate.GateReport:
+        suite = run_quality_gates(
+            [str(project)],
+            coverage_percent=100.0,
+            lint_tools=("pytool",),
+            security_tools=(),
+            runs_root=runs_root,
+        )
+        assert suite.passed
+        return suite.reports[0]
+
+    first = run_gates()
+    assert not first.details.startswith("cached:")
+
+    # The record file and gate cache written under runs_root (and anything
+    # in pruned directories like __pycache__) must not perturb the key, so
+    # identical re-runs keep hitting.
+    second = run_gates()
+    assert second.details.startswith("cached:")
+    third = run_gates()
+    assert third.details.startswith("cached:")
+
+    (project / "pkg" / "module.py").write_text("VALUE = 2\n")
+    fourth = run_gates()
+    assert not fourth.details.startswith("cached:")
+
+
+def test_run_quality_gates_skips_tools_without_binaries(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    scanner = SecurityScanner(tools={"ghost": ("acms-no-such-binary",)})
+    monkeypatch.setattr(code_gate, "DEFAULT_SECURITY_SCANNER", scanner)
+
+    suite = run_quality_gates(
+        [str(tmp_path)],
+        coverage_percent=100.0,
+        lint_tools=(),
+        security_tools=("ghost",),
+        runs_root=tmp_path / ".runs",
+    )
+    report = suite.reports[0]
+    assert report.status is GateStatus.SKIPPED
+    assert "not found on PATH" in report.details
+
+
+def test_run_quality_gates_raises_for_unconfigured_tools(tmp_path: Path) -> None:
+    with pytest.raises(KeyError, match="no-such-scanner"):
+        run_quality_gates(
+            [str(tmp_path)],
+            coverage_percent=100.0,
+            lint_tools=(),
+            security_tools=("no-such-scanner",),
+            runs_root=tmp_path / ".runs",
+        )
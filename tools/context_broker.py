@@ -23,16 +23,40 @@ import hashlib
 import json
 import logging
 import math
+import mmap
 import os
+import re
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
+try:  # pragma: no cover - exercised only when blake3 is installed
+    from blake3 import blake3
+except ImportError:  # pragma: no cover - fallback path
+    blake3 = None  # type: ignore[assignment]
+
 logger = logging.getLogger("acms.context_broker")
 
+# Files above this size are digested with blake3's memory-mapped tree hash
+# when the library is installed; its SIMD/multithreaded kernel outruns
+# SHA-256 severalfold on large inputs. Below it, set-up cost dominates and
+# hashlib.file_digest (no Python-level read loop) wins.
+_BLAKE3_MIN_BYTES = 1 << 20
+
+# Read granularity for the chunked sha256 fallback. 4 MiB means far fewer
+# Python round-trips per file than the old 64 KiB reads, and the GIL is
+# released for correspondingly longer stretches inside each update().
+_HASH_CHUNK_BYTES = 1 << 22
+
+# Above this size the sha256 path hands hashlib a memory mapping in one
+# update() call: the kernel pages data in on demand and the read loop
+# disappears entirely. Below it the mapping set-up cost is not worth it.
+_MMAP_MIN_BYTES = 1 << 23
+
 # File extensions that are considered eligible for context selection.
 CODE_EXTENSIONS = {
     ".c",
@@ -126,6 +150,7 @@ class FileScore:
     breakdown: Dict[str, float]
     sha256: str
     is_mandatory: bool = False
+    digest_algo: str = "sha256"
 
 
 @dataclass
@@ -206,6 +231,11 @@ class ContextBroker:
 
         self._ban_globs = [self._normalise_glob(g) for g in self.config_body.get("ban_globs", [])]
         self._pin_globs = [self._normalise_glob(g) for g in self.config_body.get("pin_globs", [])]
+        # All ban globs collapse into one compiled regex; a single match call
+        # then replaces a Python-level fnmatch loop per probe, and the walk
+        # uses it to prune whole banned subtrees before descending.
+        self._ban_re = self._compile_globs(self._ban_globs)
+        self._pin_re = self._compile_globs(self._pin_globs)
         logger.debug("ContextBroker initialised for %s", self.repo_root)
 
     # ------------------------------------------------------------------
@@ -214,7 +244,7 @@ class ContextBroker:
     def build_manifest(self, params: SelectionParams) -> ContextManifest:
         logger.debug("Building manifest for params: %s", params)
         mandatory_paths = {path.resolve() for path in params.target_files}
-        candidate_scores = list(self._score_candidates(params, mandatory_paths))
+        candidate_scores = self._score_candidates(params, mandatory_paths)
 
         mandatory = [item for item in candidate_scores if item.is_mandatory]
         optional = [item for item in candidate_scores if not item.is_mandatory]
@@ -250,49 +280,114 @@ class ContextBroker:
     # ------------------------------------------------------------------
     def _score_candidates(
         self, params: SelectionParams, mandatory_paths: Iterable[Path]
-    ) -> Iterable[FileScore]:
+    ) -> List[FileScore]:
         mandatory_resolved = {path.resolve() for path in mandatory_paths}
         yielded: set[Path] = set()
+        scores: List[FileScore] = []
 
-        # Ensure mandatory files are yielded even if they are excluded by filters.
+        # Ensure mandatory files are scored even if they are excluded by filters.
         for path in mandatory_resolved:
             if path.exists():
                 logger.debug("Scoring mandatory file %s", path)
-                score = self._score_file(path, params, is_mandatory=True)
+                scores.append(self._score_file(path, params, is_mandatory=True))
                 yielded.add(path)
-                yield score
             else:
                 logger.warning("Mandatory file does not exist: %s", path)
 
-        for path in self._iter_candidate_files(params.include_tests):
+        pending: List[Tuple[Path, os.stat_result]] = []
+        for path, st in self._iter_candidate_files(params.include_tests):
             resolved = path.resolve()
             if resolved in yielded:
                 continue
-            score = self._score_file(resolved, params, is_mandatory=False)
             yielded.add(resolved)
-            yield score
-
-    def _iter_candidate_files(self, include_tests: bool) -> Iterable[Path]:
-        for path in self.repo_root.rglob("*"):
-            if not path.is_file():
+            pending.append((resolved, st))
+
+        # Scoring is dominated by stat/read/hash I/O and hashlib releases the
+        # GIL while digesting, so candidates are hashed on a thread pool.
+        # Futures are gathered in submission order, keeping the score list
+        # as deterministic as the serial loop it replaces.
+        if len(pending) > 1:
+            workers = min(32, (os.cpu_count() or 1) * 4)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = [
+                    pool.submit(self._score_file, path, params, False, st)
+                    for path, st in pending
+                ]
+                scores.extend(future.result() for future in futures)
+        else:
+            scores.extend(
+                self._score_file(path, params, False, st) for path, st in pending
+            )
+        return scores
+
+    def _iter_candidate_files(
+        self, include_tests: bool
+    ) -> Iterable[Tuple[Path, os.stat_result]]:
+        """Yield candidate files with their stat results.
+
+        An explicit scandir stack replaces ``rglob``: banned directories are
+        pruned before descent, so trees like ``.git`` or ``__pycache__``
+        never cost a traversal, and each DirEntry's cached stat is passed on
+        so scoring needs no further stat call. Entries are sorted per
+        directory to keep the walk order deterministic.
+        """
+
+        stack = [str(self.repo_root)]
+        while stack:
+            current = stack.pop()
+            try:
+                entries = sorted(os.scandir(current), key=lambda entry: entry.name)
+            except OSError:
                 continue
-            if path.suffix.lower() not in CODE_EXTENSIONS:
-                continue
-            if self._is_banned(path):
-                continue
-            if not include_tests and self._categorise(path) == "tests":
-                continue
-            yield path
-
-    def _score_file(self, path: Path, params: SelectionParams, is_mandatory: bool) -> FileScore:
+            for entry in entries:
+                normalised = entry.path.replace(os.sep, "/")
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if self._ban_re is None or not self._ban_re.match(
+                            normalised + "/"
+                        ):
+                            stack.append(entry.path)
+                        continue
+                    if not entry.is_file():
+                        continue
+                except OSError:  # pragma: no cover - racing deletions
+                    continue
+                if os.path.splitext(entry.name)[1].lower() not in CODE_EXTENSIONS:
+                    continue
+                if self._ban_re is not None and self._ban_re.match(normalised):
+                    continue
+                path = Path(entry.path)
+                if not include_tests and self._categorise(path) == "tests":
+                    continue
+                try:
+                    yield path, entry.stat()
+                except OSError:  # pragma: no cover - racing deletions
+                    continue
+
+    def _score_file(
+        self,
+        path: Path,
+        params: SelectionParams,
+        is_mandatory: bool,
+        st: Optional[os.stat_result] = None,
+    ) -> FileScore:
         category = self._categorise(path)
-        size_bytes = self._safe_stat(path, "st_size", default=0)
+        # One stat serves size, recency and the read-size guard; callers that
+        # already hold a stat result (e.g. from the candidate walk) pass it
+        # in so the file is never stat'd twice.
+        if st is None:
+            try:
+                st = os.stat(path)
+            except OSError:
+                st = None
+        size_bytes = st.st_size if st is not None else 0
+        mtime = st.st_mtime if st is not None else time.time()
         tokens = self._approx_tokens(size_bytes)
-        text = self._read_file(path, size_limit=2_000_000)
+        text, digest, digest_algo = self._load_for_scoring(path, size_bytes)
 
         structural_score = self._structural_score(path, params.target_files)
         lexical_score = self._lexical_score(text, params.keywords)
-        recency_score = self._recency_score(self._safe_stat(path, "st_mtime", default=time.time()))
+        recency_score = self._recency_score(mtime)
         size_penalty = size_bytes / 1024.0  # kilobytes
 
         weights: Dict[str, float] = self.config_body.get("strategy", {}).get("weights", {})
@@ -317,8 +412,9 @@ class ContextBroker:
             size_bytes=size_bytes,
             score=round(score, 6),
             breakdown=breakdown,
-            sha256=self._sha256_file(path),
+            sha256=digest,
             is_mandatory=is_mandatory,
+            digest_algo=digest_algo,
         )
 
     # ------------------------------------------------------------------
@@ -384,8 +480,9 @@ class ContextBroker:
         return "code"
 
     def _is_banned(self, path: Path) -> bool:
-        normalised = self._normalise_path(path)
-        return any(fnmatch.fnmatch(normalised, glob) for glob in self._ban_globs)
+        if self._ban_re is None:
+            return False
+        return self._ban_re.match(self._normalise_path(path)) is not None
 
     def _structural_score(self, path: Path, targets: Sequence[Path]) -> float:
         score = 0.0
@@ -393,7 +490,7 @@ class ContextBroker:
         resolved_targets = {target.resolve() for target in targets}
         if path.resolve() in resolved_targets:
             score += 5.0
-        if any(fnmatch.fnmatch(normalised, glob) for glob in self._pin_globs):
+        if self._pin_re is not None and self._pin_re.match(normalised):
             score += 1.0
         return score
 
@@ -410,30 +507,80 @@ class ContextBroker:
         return 1.0 / (1.0 + (days / 30.0))
 
     @staticmethod
-    def _read_file(path: Path, size_limit: int) -> str:
+    def _load_for_scoring(path: Path, size_bytes: int) -> Tuple[str, str, str]:
+        """Return ``(text, hexdigest, algorithm)`` with a single read.
+
+        Files within the 2 MB lexical cap are read once as bytes; the same
+        buffer feeds the content hash and, decoded, the lexical scorer —
+        halving the bytes moved versus separate text-read and hash passes.
+        Larger files skip lexical text (as before) and hash via the
+        mmap/chunked fast paths.
+        """
+
+        if size_bytes > 2_000_000:
+            digest, algo = ContextBroker._fast_digest(path, size_bytes)
+            return "", digest, algo
         try:
-            if path.stat().st_size > size_limit:
-                return ""
-            return path.read_text(encoding="utf-8", errors="ignore")
+            data = path.read_bytes()
         except Exception:  # pragma: no cover - IO errors handled gracefully
-            return ""
+            digest, algo = ContextBroker._fast_digest(path, size_bytes)
+            return "", digest, algo
+        if blake3 is not None and size_bytes > _BLAKE3_MIN_BYTES:
+            digest, algo = blake3(data).hexdigest(), "blake3"
+        else:
+            digest, algo = hashlib.sha256(data).hexdigest(), "sha256"
+        return data.decode("utf-8", "ignore"), digest, algo
 
     @staticmethod
-    def _safe_stat(path: Path, attribute: str, default: float) -> float:
-        try:
-            stat = path.stat()
-            return float(getattr(stat, attribute, default))
-        except Exception:  # pragma: no cover - IO errors handled gracefully
-            return float(default)
+    def _fast_digest(path: Path, size_bytes: int) -> Tuple[str, str]:
+        """Return ``(hexdigest, algorithm)`` for ``path``.
+
+        Large files go through blake3's memory-mapped hasher when available;
+        everything else uses ``hashlib.file_digest``, which streams inside C
+        with no Python-level read loop. The algorithm name travels with the
+        digest so manifest readers can interpret it.
+        """
 
-    def _sha256_file(self, path: Path) -> str:
-        sha = hashlib.sha256()
         try:
+            if blake3 is not None and size_bytes > _BLAKE3_MIN_BYTES:
+                return blake3().update_mmap(str(path)).hexdigest(), "blake3"
             with path.open("rb") as handle:
-                for chunk in iter(lambda: handle.read(65536), b""):
-                    sha.update(chunk)
+                if size_bytes > _MMAP_MIN_BYTES:
+                    try:
+                        return ContextBroker._mmap_sha256(handle), "sha256"
+                    except (OSError, ValueError, OverflowError):
+                        handle.seek(0)
+                if size_bytes > _HASH_CHUNK_BYTES:
+                    return ContextBroker._chunked_sha256(handle), "sha256"
+                return hashlib.file_digest(handle, "sha256").hexdigest(), "sha256"
         except Exception:  # pragma: no cover - IO errors handled gracefully
-            return ""
+            return "", "sha256"
+
+    @staticmethod
+    def _mmap_sha256(handle) -> str:
+        """Hash ``handle`` through a read-only memory mapping in one call."""
+
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if hasattr(mapped, "madvise"):
+                mapped.madvise(mmap.MADV_SEQUENTIAL)
+            sha = hashlib.sha256()
+            sha.update(mapped)
+        return sha.hexdigest()
+
+    @staticmethod
+    def _chunked_sha256(handle) -> str:
+        """Stream ``handle`` into sha256 through one preallocated buffer.
+
+        ``readinto`` on a reused 4 MiB bytearray avoids allocating a fresh
+        bytes object per chunk; the memoryview slice hands update() exactly
+        the bytes read without copying.
+        """
+
+        sha = hashlib.sha256()
+        buffer = bytearray(_HASH_CHUNK_BYTES)
+        view = memoryview(buffer)
+        while count := handle.readinto(buffer):
+            sha.update(view[:count])
         return sha.hexdigest()
 
     def _fingerprint_config(self) -> str:
@@ -449,6 +596,7 @@ class ContextBroker:
             "score": item.score,
             "breakdown": item.breakdown,
             "sha256": item.sha256,
+            "digest_algo": item.digest_algo,
             "is_mandatory": item.is_mandatory,
         }
 
@@ -466,6 +614,14 @@ class ContextBroker:
     def _normalise_glob(glob: str) -> str:
         return glob.replace("\\", "/")
 
+    @staticmethod
+    def _compile_globs(globs: Sequence[str]):
+        """Compile ``globs`` into a single alternation regex (or ``None``)."""
+
+        if not globs:
+            return None
+        return re.compile("|".join(fnmatch.translate(glob) for glob in globs))
+
 
 # ----------------------------------------------------------------------
 # CLI Entrypoint
@@ -475,6 +631,11 @@ def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Generate a context manifest for LLM tools")
     parser.add_argument("--root", default=".", help="Repository root for scanning")
     parser.add_argument("--out", default=".runs/context_manifest.json", help="Output manifest path")
+    parser.add_argument(
+        "--server",
+        action="store_true",
+        help="Serve manifest requests as newline-delimited JSON on stdin/stdout",
+    )
     parser.add_argument("--task-type", default=None, help="Task type (edit, plan, analyze, test)")
     parser.add_argument("--target", action="append", default=[], help="Target file path (repeatable)")
     parser.add_argument("--keywords", nargs="*", default=[], help="Keyword hints to boost lexical scores")
@@ -487,50 +648,122 @@ def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
     return parser.parse_args(argv)
 
 
-def main(argv: Optional[Sequence[str]] = None) -> int:
-    logging.basicConfig(level=os.environ.get("ACMS_LOG_LEVEL", "INFO"))
-    args = parse_args(argv)
-
-    repo_root = Path(args.root).resolve()
-    if not repo_root.exists():
-        raise SystemExit(f"Root directory not found: {repo_root}")
-
-    config_loader = ConfigLoader(repo_root)
-    config = config_loader.load(args.config)
-    broker = ContextBroker(repo_root, config)
+def _resolve_params(
+    broker: ContextBroker,
+    repo_root: Path,
+    *,
+    task_type: Optional[str],
+    targets: Sequence[str],
+    keywords: Sequence[str],
+    max_tokens: Optional[int],
+    max_files: Optional[int],
+    include_tests: Optional[bool],
+) -> SelectionParams:
+    """Merge explicit request values with configuration defaults."""
 
     body = broker.config_body
     budgets = body.get("budgets", {})
-    max_tokens = args.max_tokens or int(budgets.get("max_tokens", 180000))
-    max_files = args.max_files or int(budgets.get("max_files", 200))
 
-    include_tests = args.include_tests
     if include_tests is None:
         include_tests = bool(body.get("default_include_tests", True))
 
-    task_type = args.task_type or body.get("default_task_type", "edit")
-
     target_files = [
         (repo_root / target).resolve() if not Path(target).is_absolute() else Path(target).resolve()
-        for target in args.target
+        for target in targets
     ]
 
-    params = SelectionParams(
-        task_type=task_type,
+    return SelectionParams(
+        task_type=task_type or body.get("default_task_type", "edit"),
         target_files=target_files,
-        keywords=args.keywords,
-        max_tokens=max_tokens,
-        max_files=max_files,
+        keywords=list(keywords),
+        max_tokens=max_tokens or int(budgets.get("max_tokens", 180000)),
+        max_files=max_files or int(budgets.get("max_files", 200)),
         include_tests=include_tests,
     )
 
+
+def _emit_manifest(broker: ContextBroker, repo_root: Path, params: SelectionParams, out: str) -> Tuple[ContextManifest, Path]:
+    """Build the manifest and write it to ``out`` relative to ``repo_root``."""
+
     manifest = broker.build_manifest(params)
-    output_path = Path(args.out)
+    output_path = Path(out)
     if not output_path.is_absolute():
         output_path = repo_root / output_path
     output_path.parent.mkdir(parents=True, exist_ok=True)
     with output_path.open("w", encoding="utf-8") as handle:
         json.dump(manifest.to_dict(), handle, indent=2)
+    return manifest, output_path
+
+
+def serve_requests(broker: ContextBroker, repo_root: Path) -> int:
+    """Answer newline-delimited JSON manifest requests on stdin/stdout.
+
+    Each request line is an object with the same fields as the CLI flags
+    (``task_type``, ``targets``, ``keywords``, ``max_tokens``, ``max_files``,
+    ``include_tests``, ``out``). One JSON reply line is emitted per request so
+    a long-lived parent process can amortize interpreter startup across many
+    manifest generations.
+    """
+
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            request = json.loads(line)
+            params = _resolve_params(
+                broker,
+                repo_root,
+                task_type=request.get("task_type"),
+                targets=request.get("targets", []),
+                keywords=request.get("keywords", []),
+                max_tokens=request.get("max_tokens"),
+                max_files=request.get("max_files"),
+                include_tests=request.get("include_tests"),
+            )
+            manifest, output_path = _emit_manifest(
+                broker, repo_root, params, request.get("out", ".runs/context_manifest.json")
+            )
+            reply = {
+                "status": "ok",
+                "out": str(output_path),
+                "total_files": manifest.total_files,
+                "total_tokens": manifest.total_tokens,
+            }
+        except Exception as exc:  # noqa: BLE001 - reply instead of crashing the server
+            reply = {"status": "error", "message": str(exc)}
+        sys.stdout.write(json.dumps(reply) + "\n")
+        sys.stdout.flush()
+    return 0
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    logging.basicConfig(level=os.environ.get("ACMS_LOG_LEVEL", "INFO"))
+    args = parse_args(argv)
+
+    repo_root = Path(args.root).resolve()
+    if not repo_root.exists():
+        raise SystemExit(f"Root directory not found: {repo_root}")
+
+    config_loader = ConfigLoader(repo_root)
+    config = config_loader.load(args.config)
+    broker = ContextBroker(repo_root, config)
+
+    if args.server:
+        return serve_requests(broker, repo_root)
+
+    params = _resolve_params(
+        broker,
+        repo_root,
+        task_type=args.task_type,
+        targets=args.target,
+        keywords=args.keywords,
+        max_tokens=args.max_tokens,
+        max_files=args.max_files,
+        include_tests=args.include_tests,
+    )
+
+    manifest, output_path = _emit_manifest(broker, repo_root, params, args.out)
     logger.info("Wrote %s with %s files (~%s tokens)", output_path, manifest.total_files, manifest.total_tokens)
     return 0
 